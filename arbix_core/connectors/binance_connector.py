@@ -1,18 +1,49 @@
 # arbix_core/connectors/binance_connector.py
-import configparser
 import logging
 from binance.client import Client
 import pandas as pd
 from datetime import datetime
 
+from .clock_sync import ClockSync, DEFAULT_RECV_WINDOW_MS
+from arbix_core.utils.config_service import get_config_service
+
 logger = logging.getLogger(__name__)
 
+def klines_to_df(klines_raw: list) -> pd.DataFrame:
+    """
+    Converts a raw futures_klines payload (list of lists, as returned by Binance) into a
+    DataFrame indexed by open_time with numeric columns. Shared by the live connector and replay.
+    """
+    df = pd.DataFrame(klines_raw, columns=[
+        'open_time', 'open', 'high', 'low', 'close', 'volume',
+        'close_time', 'quote_asset_volume', 'number_of_trades',
+        'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
+    ])
+
+    # Convert data types
+    df['open_time'] = pd.to_datetime(df['open_time'], unit='ms')
+    df['close_time'] = pd.to_datetime(df['close_time'], unit='ms')
+
+    numeric_cols = ['open', 'high', 'low', 'close', 'volume', 
+                    'quote_asset_volume', 'taker_buy_base_asset_volume', 
+                    'taker_buy_quote_asset_volume']
+    for col in numeric_cols:
+        df[col] = pd.to_numeric(df[col])
+
+    df['number_of_trades'] = df['number_of_trades'].astype(int)
+
+    # Set open_time as index
+    df.set_index('open_time', inplace=True)
+
+    # We might not need all columns, can drop 'ignore'
+    df.drop(columns=['ignore'], inplace=True, errors='ignore')
+    return df
+
 class BinanceConnector:
     def __init__(self, config_path='config/config.ini', testnet=True):
-        config = configparser.ConfigParser()
-        if not config.read(config_path):
-            logger.error(f"Configuration file {config_path} not found or unreadable.")
-            raise FileNotFoundError(f"Configuration file {config_path} not found.")
+        # Shared, already-parsed config; raises FileNotFoundError if the file is missing
+        self.config_service = get_config_service(config_path)
+        config = self.config_service
 
         self.api_key = config.get('BINANCE', 'api_key', fallback=None)
         self.api_secret = config.get('BINANCE', 'api_secret', fallback=None)
@@ -26,6 +57,10 @@ class BinanceConnector:
         # For compatibility with code expecting 'um_futures_client', we can alias it,
         # but it's the same object as self.client.
         self.um_futures_client = None 
+        # ClockSync created by _initialize_clients(); once synced, signed requests use its RTT-derived recvWindow
+        self.clock_sync = None
+        # Optional MarketDataRecorder; when attached, raw kline payloads are captured as received
+        self.recorder = None
         
         self._initialize_clients()
 
@@ -39,8 +74,7 @@ class BinanceConnector:
                 
                 # The python-binance Client (v1.0.17) used these attributes internally for futures.
                 # We need to ensure the config file has the correct futures testnet base URL.
-                config = configparser.ConfigParser()
-                config.read('config/config.ini') # Re-read for the specific URL if it's different
+                config = self.config_service # Same parsed config as __init__, no re-read
                 
                 # The library might use a variable like FUTURES_URL or similar,
                 # or it might construct it from API_URL.
@@ -84,11 +118,23 @@ class BinanceConnector:
             
             # Test connectivity using methods available on Client in v1.0.17
             self.ping_futures()
+            # Sync the clock before the first signed request so it already carries the corrected
+            # timestamp and the measured recvWindow. The caller starts its background sampling.
+            self.clock_sync = ClockSync(
+                self,
+                sample_interval_seconds=self.config_service.getfloat('CLOCK', 'sync_interval_seconds', fallback=30.0)
+            )
+            self.clock_sync.sync_now()
             self.get_futures_account_balance() # Ensure you have funds in testnet futures wallet
             
         except Exception as e:
             logger.error(f"Failed to initialize Binance client (v1.0.17): {e}", exc_info=True)
 
+    def _recv_window(self) -> int:
+        if self.clock_sync and self.clock_sync.synced:
+            return self.clock_sync.recv_window_ms()
+        return DEFAULT_RECV_WINDOW_MS
+
     def ping_futures(self):
         if not self.client:
             logger.warning("Binance client not initialized.")
@@ -109,7 +155,7 @@ class BinanceConnector:
             logger.warning("Binance client not initialized.")
             return None
         try:
-            response = self.client.futures_account(recvWindow=6000)
+            response = self.client.futures_account(recvWindow=self._recv_window())
             balance_assets = response.get('assets', []) 
             logger.info("Successfully fetched Futures account details (using client.futures_account).")
             
@@ -190,33 +236,13 @@ class BinanceConnector:
             #   ]
             # ]
             klines_raw = self.client.futures_klines(**params)
+            if self.recorder:
+                self.recorder.record_klines(symbol, interval, params, klines_raw)
             if not klines_raw:
                 logger.info(f"No klines returned for {symbol} {interval} with params {params}")
                 return pd.DataFrame() # Return empty DataFrame
 
-            df = pd.DataFrame(klines_raw, columns=[
-                'open_time', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_asset_volume', 'number_of_trades',
-                'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-            ])
-
-            # Convert data types
-            df['open_time'] = pd.to_datetime(df['open_time'], unit='ms')
-            df['close_time'] = pd.to_datetime(df['close_time'], unit='ms')
-            
-            numeric_cols = ['open', 'high', 'low', 'close', 'volume', 
-                            'quote_asset_volume', 'taker_buy_base_asset_volume', 
-                            'taker_buy_quote_asset_volume']
-            for col in numeric_cols:
-                df[col] = pd.to_numeric(df[col])
-            
-            df['number_of_trades'] = df['number_of_trades'].astype(int)
-
-            # Set open_time as index
-            df.set_index('open_time', inplace=True)
-            
-            # We might not need all columns, can drop 'ignore'
-            df.drop(columns=['ignore'], inplace=True, errors='ignore')
+            df = klines_to_df(klines_raw)
 
             logger.info(f"Successfully fetched and processed {len(df)} klines for {symbol} {interval}.")
             return df
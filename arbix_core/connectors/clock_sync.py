@@ -0,0 +1,136 @@
+# arbix_core/connectors/clock_sync.py
+import logging
+import math
+import statistics
+import threading
+import time
+from collections import deque
+
+from arbix_core.utils.time_utils import now_ms
+
+logger = logging.getLogger(__name__) # Will be arbix_core.connectors.clock_sync
+
+DEFAULT_RECV_WINDOW_MS = 6000 # Used until the first successful sample
+
+
+class ClockSync:
+    """
+    Tracks the offset between the local clock and the Binance Futures server clock.
+
+    A background thread samples futures_time() periodically. Each sample gives a round-trip
+    time and an offset (server time minus the local midpoint of the request); the offset of
+    the lowest-RTT sample in the recent window is used, since it has the smallest uncertainty.
+    The estimate is pushed into the client's timestamp_offset so signed requests carry a
+    corrected timestamp, and recv_window_ms() sizes recvWindow from the observed RTTs.
+    """
+
+    def __init__(self, connector, sample_interval_seconds: float = 30.0, window: int = 16,
+                 recv_window_margin_ms: int = 250, min_recv_window_ms: int = 1000, max_recv_window_ms: int = 60000):
+        """
+        :param connector: BinanceConnector whose client is used for sampling.
+        :param sample_interval_seconds: Seconds between background samples.
+        :param window: Number of recent samples kept.
+        :param recv_window_margin_ms: Safety margin added on top of the RTT-derived recvWindow.
+        :param min_recv_window_ms: Lower bound for recvWindow.
+        :param max_recv_window_ms: Upper bound for recvWindow (Binance rejects values above 60000).
+        """
+        self.connector = connector
+        self.sample_interval_seconds = sample_interval_seconds
+        self.recv_window_margin_ms = recv_window_margin_ms
+        self.min_recv_window_ms = min_recv_window_ms
+        self.max_recv_window_ms = max_recv_window_ms
+        self._samples = deque(maxlen=window) # (rtt_ms, offset_ms)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.offset_ms = 0.0
+        self.rtt_ms = math.nan
+
+    @property
+    def synced(self) -> bool:
+        return len(self._samples) > 0
+
+    def sample(self) -> bool:
+        """Takes one offset/RTT sample. Returns True on success."""
+        client = self.connector.client if self.connector else None
+        if not client:
+            logger.warning("ClockSync: Binance client not initialized, cannot sample server time.")
+            return False
+        try:
+            start = time.perf_counter()
+            local_start_ms = now_ms()
+            server_ms = client.futures_time()['serverTime']
+            rtt_ms = (time.perf_counter() - start) * 1000
+        except Exception as e:
+            logger.warning(f"ClockSync: failed to sample server time: {e}")
+            return False
+
+        offset_ms = server_ms - (local_start_ms + rtt_ms / 2)
+        with self._lock:
+            self._samples.append((rtt_ms, offset_ms))
+            best_rtt, best_offset = min(self._samples)
+            self.offset_ms = best_offset
+            self.rtt_ms = best_rtt
+        if hasattr(client, 'timestamp_offset'):
+            client.timestamp_offset = int(round(self.offset_ms))
+        logger.debug(f"ClockSync sample: rtt={rtt_ms:.1f}ms offset={offset_ms:.1f}ms "
+                     f"(using offset={self.offset_ms:.1f}ms from best rtt={self.rtt_ms:.1f}ms)")
+        return True
+
+    def sync_now(self, samples: int = 5) -> bool:
+        """Takes several back-to-back samples, e.g. at startup. Returns True if any succeeded."""
+        results = [self.sample() for _ in range(samples)]
+        if any(results):
+            logger.info(f"ClockSync: server offset {self.offset_ms:.1f}ms, RTT {self.rtt_ms:.1f}ms, "
+                        f"recvWindow {self.recv_window_ms()}ms.")
+        return any(results)
+
+    def server_time_ms(self) -> int:
+        """Current time on the server clock, estimated from the local clock and the offset."""
+        return int(now_ms() + self.offset_ms)
+
+    def local_time_for(self, server_ms: float) -> float:
+        """Local epoch milliseconds at which the server clock will read `server_ms`."""
+        return server_ms - self.offset_ms
+
+    def recv_window_ms(self) -> int:
+        """
+        recvWindow for signed requests: the worst recent RTT (the request's travel time plus the
+        offset's uncertainty) and a safety margin, within [min_recv_window_ms, max_recv_window_ms].
+        """
+        with self._lock:
+            if not self._samples:
+                return DEFAULT_RECV_WINDOW_MS
+            worst_rtt = max(rtt for rtt, _ in self._samples)
+        window = int(math.ceil(worst_rtt + self.recv_window_margin_ms))
+        return max(self.min_recv_window_ms, min(self.max_recv_window_ms, window))
+
+    def stats(self) -> dict:
+        with self._lock:
+            rtts = [rtt for rtt, _ in self._samples]
+        return {
+            'offset_ms': self.offset_ms,
+            'best_rtt_ms': self.rtt_ms,
+            'median_rtt_ms': statistics.median(rtts) if rtts else math.nan,
+            'samples': len(rtts),
+            'recv_window_ms': self.recv_window_ms(),
+        }
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.sample_interval_seconds):
+            self.sample()
+
+    def start(self) -> None:
+        """Starts background sampling (daemon thread)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='arbix-clock-sync', daemon=True)
+        self._thread.start()
+        logger.info(f"ClockSync started, sampling every {self.sample_interval_seconds}s.")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
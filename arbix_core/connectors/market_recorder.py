@@ -0,0 +1,199 @@
+# arbix_core/connectors/market_recorder.py
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+
+from arbix_core.utils.time_utils import now_ms
+
+logger = logging.getLogger(__name__) # Will be arbix_core.connectors.market_recorder
+
+# Data file: a sequence of frames, each a header followed by a zlib-compressed chunk of
+# JSON lines (one record per line). Header: magic, compressed length, record count,
+# first and last receive time (ms).
+_FRAME_MAGIC = b'ARBX'
+_FRAME_HEADER = struct.Struct('<4sIIqq')
+# Index file (<data file>.idx): one entry per frame: offset, frame length, count, first/last time.
+_INDEX_ENTRY = struct.Struct('<QIIqq')
+
+
+class ChunkInfo:
+    def __init__(self, offset: int, length: int, count: int, first_ms: int, last_ms: int):
+        self.offset = offset
+        self.length = length
+        self.count = count
+        self.first_ms = first_ms
+        self.last_ms = last_ms
+
+
+class MarketDataRecorder:
+    """
+    Captures raw market data payloads, with their local receive time, into an append-only file.
+
+    Records are buffered and written as compressed chunks of `chunk_records` records (or sooner
+    once the oldest buffered record is `flush_interval_seconds` old), each chunk also appended to
+    a small index so readers can seek by time. Appending to an existing recording is supported;
+    at most the unflushed chunk is lost on a crash.
+    """
+
+    def __init__(self, path: str, chunk_records: int = 256, flush_interval_seconds: float = 5.0,
+                 compression_level: int = 6):
+        self.path = path
+        self.index_path = path + '.idx'
+        self.chunk_records = chunk_records
+        self.flush_interval_seconds = flush_interval_seconds
+        self.compression_level = compression_level
+        self._buffer = []
+        self._buffer_started = None
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._recover_tail()
+        self._data_file = open(path, 'ab')
+        self._index_file = open(self.index_path, 'ab')
+        self.records_written = 0
+        logger.info(f"MarketDataRecorder writing to {path} (chunk={chunk_records} records).")
+
+    def _recover_tail(self) -> None:
+        """
+        Repairs the end of a recording left by a crash before appending to it: complete frames
+        missing from the index are indexed, and a partial frame or index entry is cut off.
+        Otherwise the new frames would be written after the damage, where the reader can't
+        reach the frames before them, or misaligned with a half-written index entry.
+        """
+        if not os.path.exists(self.path):
+            return
+        chunks = MarketDataReader(self.path).chunks
+        data_end = chunks[-1].offset + chunks[-1].length if chunks else 0
+        index_size = os.path.getsize(self.index_path) if os.path.exists(self.index_path) else 0
+        if os.path.getsize(self.path) == data_end and index_size == len(chunks) * _INDEX_ENTRY.size:
+            return
+        logger.warning(f"MarketDataRecorder: repairing the tail of {self.path} ({len(chunks)} complete chunks).")
+        with open(self.path, 'rb+') as f:
+            f.truncate(data_end)
+        with open(self.index_path, 'wb') as f:
+            for chunk in chunks:
+                f.write(_INDEX_ENTRY.pack(chunk.offset, chunk.length, chunk.count, chunk.first_ms, chunk.last_ms))
+
+    def record(self, kind: str, payload, recv_ms: int = None, **fields) -> None:
+        """
+        Buffers one record.
+        :param kind: Payload type, e.g. "klines" (later "depth").
+        :param payload: The raw payload exactly as received (must be JSON-serializable).
+        :param recv_ms: Local receive time; now when omitted.
+        :param fields: Extra routing fields (symbol, interval, request params...).
+        """
+        record = {'t': recv_ms if recv_ms is not None else now_ms(), 'kind': kind, **fields, 'payload': payload}
+        with self._lock:
+            if not self._buffer:
+                self._buffer_started = time.monotonic()
+            self._buffer.append(record)
+            if len(self._buffer) >= self.chunk_records or \
+                    time.monotonic() - self._buffer_started >= self.flush_interval_seconds:
+                self._flush_locked()
+
+    def record_klines(self, symbol: str, interval: str, params: dict, klines_raw: list, recv_ms: int = None) -> None:
+        """Records a futures_klines response together with the request parameters."""
+        try:
+            self.record('klines', klines_raw, recv_ms, symbol=symbol, interval=interval, params=params)
+        except Exception as e: # Recording must never break the live path
+            logger.error(f"MarketDataRecorder failed to record klines for {symbol} {interval}: {e}")
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        lines = '\n'.join(json.dumps(record, separators=(',', ':')) for record in self._buffer)
+        compressed = zlib.compress(lines.encode('utf-8'), self.compression_level)
+        first_ms, last_ms = self._buffer[0]['t'], self._buffer[-1]['t']
+        header = _FRAME_HEADER.pack(_FRAME_MAGIC, len(compressed), len(self._buffer), first_ms, last_ms)
+        offset = self._data_file.tell()
+        self._data_file.write(header + compressed)
+        self._data_file.flush()
+        # The index is written after the frame, so an index entry never points at a partial frame
+        self._index_file.write(_INDEX_ENTRY.pack(offset, len(header) + len(compressed), len(self._buffer), first_ms, last_ms))
+        self._index_file.flush()
+        self.records_written += len(self._buffer)
+        self._buffer = []
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._data_file.close()
+            self._index_file.close()
+        logger.info(f"MarketDataRecorder closed {self.path} ({self.records_written} records).")
+
+
+class MarketDataReader:
+    """
+    Reads a recording made by MarketDataRecorder.
+
+    Uses the index to skip chunks outside a requested time range. If the index is missing or
+    behind the data file (e.g. after a crash), the remaining frames are found by scanning.
+    """
+
+    def __init__(self, path: str):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Recording {path} not found.")
+        self.path = path
+        self.chunks = self._load_index()
+
+    def _load_index(self) -> list:
+        chunks = []
+        index_path = self.path + '.idx'
+        data_size = os.path.getsize(self.path)
+        if os.path.exists(index_path):
+            with open(index_path, 'rb') as f:
+                raw = f.read()
+            usable = len(raw) - len(raw) % _INDEX_ENTRY.size
+            for fields in _INDEX_ENTRY.iter_unpack(raw[:usable]):
+                chunk = ChunkInfo(*fields)
+                if chunk.offset + chunk.length > data_size:
+                    break
+                chunks.append(chunk)
+        scan_from = chunks[-1].offset + chunks[-1].length if chunks else 0
+        if scan_from < data_size:
+            recovered = self._scan_frames(scan_from, data_size)
+            if recovered:
+                logger.warning(f"MarketDataReader: recovered {len(recovered)} unindexed chunks in {self.path}.")
+            chunks.extend(recovered)
+        return chunks
+
+    def _scan_frames(self, offset: int, data_size: int) -> list:
+        chunks = []
+        with open(self.path, 'rb') as f:
+            while offset + _FRAME_HEADER.size <= data_size:
+                f.seek(offset)
+                magic, length, count, first_ms, last_ms = _FRAME_HEADER.unpack(f.read(_FRAME_HEADER.size))
+                frame_length = _FRAME_HEADER.size + length
+                if magic != _FRAME_MAGIC or offset + frame_length > data_size:
+                    break # Truncated tail from an interrupted write
+                chunks.append(ChunkInfo(offset, frame_length, count, first_ms, last_ms))
+                offset += frame_length
+        return chunks
+
+    def __len__(self) -> int:
+        return sum(chunk.count for chunk in self.chunks)
+
+    def records(self, start_ms: int = None, end_ms: int = None, kinds: tuple = None):
+        """Yields records in recording order, optionally limited to a receive-time range and kinds."""
+        with open(self.path, 'rb') as f:
+            for chunk in self.chunks:
+                if (start_ms is not None and chunk.last_ms < start_ms) or \
+                        (end_ms is not None and chunk.first_ms > end_ms):
+                    continue
+                f.seek(chunk.offset + _FRAME_HEADER.size)
+                lines = zlib.decompress(f.read(chunk.length - _FRAME_HEADER.size)).decode('utf-8')
+                for line in lines.split('\n'):
+                    record = json.loads(line)
+                    if start_ms is not None and record['t'] < start_ms:
+                        continue
+                    if end_ms is not None and record['t'] > end_ms:
+                        return
+                    if kinds is None or record['kind'] in kinds:
+                        yield record
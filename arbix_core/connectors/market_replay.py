@@ -0,0 +1,134 @@
+# arbix_core/connectors/market_replay.py
+import asyncio
+import logging
+import time
+from collections import deque
+
+import pandas as pd
+
+from .binance_connector import klines_to_df
+from .market_recorder import MarketDataReader
+
+logger = logging.getLogger(__name__) # Will be arbix_core.connectors.market_replay
+
+
+class ReplayConnector:
+    """
+    Stands in for BinanceConnector when replaying a recording.
+
+    Recorded payloads are queued per (symbol, interval) and handed out by the same
+    get_futures_klines_df() call the live pipeline uses, parsed by the same klines_to_df().
+    """
+
+    def __init__(self, reader: MarketDataReader):
+        self.reader = reader
+        self.client = reader # Truthy, like an initialized client; there is no network client in replay
+        self.clock_sync = None
+        self.recorder = None
+        self.testnet = None
+        self.current_time_ms = None # Receive time of the record being replayed
+        self._pending = {} # (symbol, interval) -> deque of raw payloads
+
+    def load_record(self, record: dict) -> None:
+        """Queues a recorded klines payload to be returned by the next matching fetch."""
+        self.current_time_ms = record['t']
+        self._pending.setdefault((record['symbol'], record['interval']), deque()).append(record['payload'])
+
+    def get_futures_server_time(self):
+        return self.current_time_ms
+
+    def get_futures_klines_df(self, symbol: str, interval: str, start_time_ms: int = None, end_time_ms: int = None,
+                              limit: int = 500) -> pd.DataFrame | None:
+        pending = self._pending.get((symbol, interval))
+        if not pending:
+            logger.warning(f"ReplayConnector: no recorded klines left for {symbol} {interval}.")
+            return None
+        klines_raw = pending.popleft()
+        if not klines_raw:
+            return pd.DataFrame()
+        return klines_to_df(klines_raw)
+
+
+class MarketReplayer:
+    """
+    Feeds a recording back through the live pipeline (ReplayConnector -> KlineFeed -> EventBus
+    -> strategies) at the original pace (speed=1), N times faster (speed=N) or as fast as
+    possible (speed=None), and reports end-to-end throughput.
+    """
+
+    def __init__(self, path: str, feed, speed: float | None = None, start_ms: int = None, end_ms: int = None):
+        """
+        :param path: Recording written by MarketDataRecorder.
+        :param feed: KlineFeed publishing onto the bus the strategies are subscribed to.
+        :param speed: Replay speed multiplier; None replays at maximum speed.
+        :param start_ms: Optional start of the receive-time range to replay.
+        :param end_ms: Optional end of the receive-time range to replay.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("Replay speed must be positive (or None for maximum speed).")
+        self.reader = MarketDataReader(path)
+        self.connector = ReplayConnector(self.reader)
+        self.feed = feed
+        self.speed = speed
+        self.start_ms = start_ms
+        self.end_ms = end_ms
+
+    async def run(self) -> dict:
+        """
+        Replays the recording and waits for the pipeline to finish processing it.
+        :return: Throughput report.
+        """
+        records = 0
+        klines = 0
+        first_record_ms = last_record_ms = None
+        wall_start = time.monotonic()
+
+        for record in self.reader.records(self.start_ms, self.end_ms, kinds=('klines',)):
+            if first_record_ms is None:
+                first_record_ms = record['t']
+            last_record_ms = record['t']
+            if self.speed is not None:
+                due = wall_start + (record['t'] - first_record_ms) / 1000 / self.speed
+                delay = due - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            symbol, interval, params = record['symbol'], record['interval'], record.get('params') or {}
+            if (symbol, interval) not in self.feed.buffers:
+                continue
+            self.connector.load_record(record)
+            klines_df = self.connector.get_futures_klines_df(
+                symbol=symbol,
+                interval=interval,
+                start_time_ms=params.get('startTime'),
+                end_time_ms=params.get('endTime'),
+                limit=params.get('limit', 500)
+            )
+            end_time = params.get('endTime')
+            await self.feed.publish(symbol, interval, klines_df, close_ms=end_time + 1 if end_time else None)
+            records += 1
+            klines += len(klines_df) if klines_df is not None else 0
+            if self.speed is None and records % 100 == 0:
+                await asyncio.sleep(0) # Let subscribers run between bursts
+
+        publish_done = time.monotonic()
+        await self.feed.bus.join()
+        wall_end = time.monotonic()
+
+        elapsed = wall_end - wall_start
+        recorded_span_s = (last_record_ms - first_record_ms) / 1000 if records else 0.0
+        report = {
+            'records': records,
+            'klines': klines,
+            'recorded_span_s': recorded_span_s,
+            'elapsed_s': elapsed,
+            'publish_s': publish_done - wall_start,
+            'drain_s': wall_end - publish_done,
+            'records_per_s': records / elapsed if elapsed > 0 else 0.0,
+            'klines_per_s': klines / elapsed if elapsed > 0 else 0.0,
+            'effective_speed': recorded_span_s / elapsed if elapsed > 0 else 0.0,
+        }
+        logger.info(f"Replay finished: {records} records ({klines} klines) in {elapsed:.2f}s "
+                    f"-> {report['records_per_s']:.0f} records/s, {report['klines_per_s']:.0f} klines/s, "
+                    f"{report['effective_speed']:.1f}x recorded time.")
+        return report
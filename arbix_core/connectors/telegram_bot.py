@@ -1,16 +1,15 @@
 import telegram
-import configparser
 import logging
 import asyncio 
 
+from arbix_core.utils.config_service import get_config_service
+
 logger = logging.getLogger(__name__) # Will be arbix_core.connectors.telegram_bot if setup_logging is called first
 
 class TelegramBot:
     def __init__(self, config_path='config/config.ini'):
-        config = configparser.ConfigParser()
-        if not config.read(config_path):
-            logger.error(f"Configuration file {config_path} not found or unreadable.")
-            raise FileNotFoundError(f"Configuration file {config_path} not found.")
+        # Shared, already-parsed config; raises FileNotFoundError if the file is missing
+        config = get_config_service(config_path)
 
         self.bot_token = config.get('TELEGRAM', 'bot_token', fallback=None)
         self.chat_id = config.get('TELEGRAM', 'chat_id', fallback=None)
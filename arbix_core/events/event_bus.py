@@ -0,0 +1,247 @@
+# arbix_core/events/event_bus.py
+import asyncio
+import inspect
+import logging
+import time
+from collections import deque
+
+from .events import Event
+
+logger = logging.getLogger(__name__) # Will be arbix_core.events.event_bus
+
+# Overflow policies for a full subscriber queue
+BLOCK = "block"              # publish() waits until the subscriber has room
+DROP_OLDEST = "drop_oldest"  # the oldest pending event is discarded
+CONFLATE = "conflate"        # a pending event with the same key is replaced by the new one
+OVERFLOW_POLICIES = (BLOCK, DROP_OLDEST, CONFLATE)
+
+_LAG_SAMPLES = 1000
+
+
+class _TopicStats:
+    def __init__(self):
+        self.published = 0
+        self.started_at = time.monotonic()
+
+
+class Subscription:
+    """
+    A subscriber's bounded queue and the task that feeds its handler.
+    Created through EventBus.subscribe(); handlers run one event at a time, in order.
+    """
+
+    def __init__(self, topic: str, name: str, handler, maxsize: int, policy: str):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {policy!r}; expected one of {OVERFLOW_POLICIES}.")
+        if maxsize < 1:
+            raise ValueError("Subscription maxsize must be >= 1.")
+        self.topic = topic
+        self.name = name
+        self.handler = handler
+        self.maxsize = maxsize
+        self.policy = policy
+        # Conflating queues are dicts keyed by event key (insertion order = arrival order)
+        self._pending = {} if policy == CONFLATE else deque()
+        self._has_items = asyncio.Event()
+        self._has_room = asyncio.Event()
+        self._has_room.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task = None
+        self._seq = 0 # Unique keys for keyless events under CONFLATE
+
+        self.delivered = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.errors = 0
+        self.max_depth = 0
+        self._lags_ms = deque(maxlen=_LAG_SAMPLES)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def put(self, event: Event) -> None:
+        if self.policy == BLOCK:
+            while len(self._pending) >= self.maxsize:
+                self._has_room.clear()
+                await self._has_room.wait()
+            self._pending.append(event)
+        elif self.policy == DROP_OLDEST:
+            if len(self._pending) >= self.maxsize:
+                self._pending.popleft()
+                self.dropped += 1
+            self._pending.append(event)
+        else: # CONFLATE
+            key = event.key
+            if key is None:
+                self._seq += 1
+                key = ('__unkeyed__', self._seq)
+            if key in self._pending:
+                self._pending[key] = event # Keeps its place in the queue, carries the latest data
+                self.conflated += 1
+            else:
+                if len(self._pending) >= self.maxsize:
+                    del self._pending[next(iter(self._pending))]
+                    self.dropped += 1
+                self._pending[key] = event
+        self.max_depth = max(self.max_depth, len(self._pending))
+        self._idle.clear()
+        self._has_items.set()
+
+    def _pop(self) -> Event:
+        if self.policy == CONFLATE:
+            return self._pending.pop(next(iter(self._pending)))
+        return self._pending.popleft()
+
+    async def _run(self) -> None:
+        while True:
+            if not self._pending:
+                self._idle.set()
+                self._has_items.clear()
+                await self._has_items.wait()
+                continue
+            event = self._pop()
+            self._has_room.set()
+            self._lags_ms.append(event.age_ms())
+            try:
+                result = self.handler(event)
+                if inspect.isawaitable(result):
+                    await result
+                self.delivered += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"EventBus subscriber [{self.name}] failed handling {event}: {e}", exc_info=True)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name=f"eventbus-{self.name}")
+
+    async def stop(self, drain: bool = True, timeout: float = 5.0) -> None:
+        if self._task is None:
+            return
+        if drain:
+            try:
+                await asyncio.wait_for(self._idle.wait(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"EventBus subscriber [{self.name}] still had {len(self)} events pending at shutdown.")
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def metrics(self) -> dict:
+        lags = sorted(self._lags_ms)
+        return {
+            'policy': self.policy,
+            'depth': len(self._pending),
+            'max_depth': self.max_depth,
+            'maxsize': self.maxsize,
+            'delivered': self.delivered,
+            'dropped': self.dropped,
+            'conflated': self.conflated,
+            'errors': self.errors,
+            'lag_mean_ms': sum(lags) / len(lags) if lags else 0.0,
+            'lag_p95_ms': lags[min(len(lags) - 1, int(len(lags) * 0.95))] if lags else 0.0,
+            'lag_max_ms': lags[-1] if lags else 0.0,
+        }
+
+
+class EventBus:
+    """
+    In-process publish/subscribe bus for KlineEvent, SignalEvent and NotificationEvent.
+
+    Each subscriber gets its own bounded queue and asyncio task, so a slow consumer only
+    affects producers according to its overflow policy (BLOCK, DROP_OLDEST or CONFLATE)
+    instead of stalling every other consumer. Per-topic throughput and per-subscriber queue
+    depth, drops and publish-to-handle lag are available from metrics().
+    """
+
+    def __init__(self):
+        self._subscriptions = {} # topic -> [Subscription]
+        self._topic_stats = {}   # topic -> _TopicStats
+        self._running = False
+
+    def subscribe(self, event_type: type, handler, name: str = None, maxsize: int = 1000,
+                  policy: str = BLOCK) -> Subscription:
+        """
+        Registers a handler (plain function or coroutine function) for an event type.
+
+        :param event_type: Event subclass to receive, e.g. KlineEvent.
+        :param name: Subscriber name used in logs and metrics.
+        :param maxsize: Queue bound for this subscriber.
+        :param policy: What happens when the queue is full: BLOCK, DROP_OLDEST or CONFLATE.
+        """
+        topic = event_type.TOPIC
+        if topic is None:
+            raise TypeError(f"{event_type!r} has no TOPIC and cannot be subscribed to.")
+        name = name or f"{topic}-{getattr(handler, '__name__', 'handler')}"
+        subscription = Subscription(topic, name, handler, maxsize, policy)
+        self._subscriptions.setdefault(topic, []).append(subscription)
+        if self._running:
+            subscription.start()
+        logger.info(f"EventBus: [{name}] subscribed to '{topic}' (maxsize={maxsize}, policy={policy}).")
+        return subscription
+
+    async def unsubscribe(self, subscription: Subscription, drain: bool = False) -> None:
+        self._subscriptions.get(subscription.topic, []).remove(subscription)
+        await subscription.stop(drain=drain)
+
+    async def publish(self, event: Event) -> None:
+        """
+        Delivers an event to every subscriber of its topic.
+        Only waits if a BLOCK subscriber's queue is full.
+        """
+        topic = event.TOPIC
+        event.published_at = time.monotonic()
+        self._topic_stats.setdefault(topic, _TopicStats()).published += 1
+        for subscription in self._subscriptions.get(topic, ()):
+            await subscription.put(event)
+
+    def start(self) -> None:
+        """Starts the subscriber tasks. Must be called from within the running event loop."""
+        self._running = True
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.start()
+
+    async def join(self) -> None:
+        """Waits until every subscriber has handled everything published so far, including follow-up events."""
+        while True:
+            busy = [s for subs in self._subscriptions.values() for s in subs if not s._idle.is_set()]
+            if not busy:
+                return
+            await busy[0]._idle.wait()
+
+    async def stop(self, drain: bool = True, timeout: float = 5.0) -> None:
+        """Stops all subscriber tasks, by default after letting them work through their queues."""
+        self._running = False
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                await subscription.stop(drain=drain, timeout=timeout)
+
+    def metrics(self) -> dict:
+        """Per-topic published count and rate, with per-subscriber queue metrics."""
+        report = {}
+        for topic in set(self._topic_stats) | set(self._subscriptions):
+            stats = self._topic_stats.get(topic)
+            elapsed = time.monotonic() - stats.started_at if stats else 0.0
+            published = stats.published if stats else 0
+            report[topic] = {
+                'published': published,
+                'rate_per_s': published / elapsed if elapsed > 0 else 0.0,
+                'subscribers': {s.name: s.metrics() for s in self._subscriptions.get(topic, ())},
+            }
+        return report
+
+    def log_metrics(self) -> None:
+        for topic, topic_metrics in sorted(self.metrics().items()):
+            logger.info(f"EventBus topic '{topic}': published={topic_metrics['published']} "
+                        f"({topic_metrics['rate_per_s']:.2f}/s)")
+            for name, m in topic_metrics['subscribers'].items():
+                logger.info(f"  [{name}] depth={m['depth']}/{m['maxsize']} (max {m['max_depth']}) "
+                            f"delivered={m['delivered']} dropped={m['dropped']} conflated={m['conflated']} "
+                            f"errors={m['errors']} lag mean={m['lag_mean_ms']:.1f}ms p95={m['lag_p95_ms']:.1f}ms")
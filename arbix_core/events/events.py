@@ -0,0 +1,72 @@
+# arbix_core/events/events.py
+import time
+
+import pandas as pd
+
+
+class Event:
+    """
+    Base class for everything published on the EventBus.
+    Subclasses set TOPIC; `key` identifies events that supersede each other
+    (used by the conflate overflow policy), None means every event is distinct.
+    """
+    TOPIC = None
+
+    def __init__(self, key=None):
+        self.key = key
+        self.published_at = None # time.monotonic(), stamped by EventBus.publish
+
+    def age_ms(self) -> float:
+        """Milliseconds since the event was published."""
+        if self.published_at is None:
+            return 0.0
+        return (time.monotonic() - self.published_at) * 1000
+
+
+class KlineEvent(Event):
+    """New closed candles for a (symbol, interval)."""
+    TOPIC = "kline"
+
+    def __init__(self, symbol: str, interval: str, klines_df: pd.DataFrame, close_ms: int = None):
+        """
+        :param klines_df: Recent closed klines (open_time index), newest last. Must not be mutated by consumers.
+        :param close_ms: Exchange time of the candle close that triggered this event.
+        """
+        super().__init__(key=(symbol, interval))
+        self.symbol = symbol
+        self.interval = interval
+        self.klines_df = klines_df
+        self.close_ms = close_ms
+
+    def __str__(self):
+        return f"KlineEvent(symbol={self.symbol}, interval={self.interval}, rows={len(self.klines_df)}, close_ms={self.close_ms})"
+
+
+class SignalEvent(Event):
+    """A signal produced by a strategy."""
+    TOPIC = "signal"
+
+    def __init__(self, strategy_id: str, signal, close_ms: int = None):
+        """
+        :param signal: The StrategySignal returned by the strategy's run().
+        :param close_ms: Exchange time of the candle close the signal was computed for.
+        """
+        super().__init__(key=strategy_id)
+        self.strategy_id = strategy_id
+        self.signal = signal
+        self.close_ms = close_ms
+
+    def __str__(self):
+        return f"SignalEvent(strategy_id={self.strategy_id}, signal={self.signal})"
+
+
+class NotificationEvent(Event):
+    """A message for the notifiers (e.g. Telegram)."""
+    TOPIC = "notification"
+
+    def __init__(self, message: str):
+        super().__init__()
+        self.message = message
+
+    def __str__(self):
+        return f"NotificationEvent(message={self.message[:50]})"
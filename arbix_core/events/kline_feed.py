@@ -0,0 +1,210 @@
+# arbix_core/events/kline_feed.py
+import logging
+
+import pandas as pd
+
+from .event_bus import EventBus
+from .events import KlineEvent
+
+logger = logging.getLogger(__name__) # Will be arbix_core.events.kline_feed
+
+# Bytes per row of an unprojected kline DataFrame from klines_to_df: the open_time index plus
+# 10 float64/int64/datetime64 columns. Every kline column is 8 bytes wide.
+_FULL_ROW_BYTES = 8 * 11
+_COLUMN_BYTES = 8
+_MB = 1024 * 1024
+
+
+class KlineFeed:
+    """
+    Keeps one buffer of recent klines per (symbol, interval) and publishes it on the bus.
+
+    This is the single place where fetched candles enter the pipeline, shared by the live
+    market data loop and the replayer, so both drive the strategies the same way.
+
+    Buffers are sized from what their consumers register: each market keeps the largest
+    number of klines any consumer needs plus `margin_klines`, and only the columns some
+    consumer reads. With a `memory_budget_bytes`, the margin is reduced (the same for every
+    market) until all buffers fit; the consumers' minimums are always kept.
+    """
+
+    def __init__(self, bus: EventBus, memory_budget_bytes: int = None, margin_klines: int = 0,
+                 mirror_row_bytes: int = 0):
+        """
+        :param memory_budget_bytes: Ceiling for all kline buffers together; None for no limit.
+        :param margin_klines: Klines kept beyond the largest consumer requirement, budget permitting.
+        :param mirror_row_bytes: Bytes per retained kline held outside the feed for every market,
+                                 e.g. shared-memory rings sized from buffer_sizes; counted against the budget.
+        """
+        self.bus = bus
+        self.memory_budget_bytes = memory_budget_bytes
+        self.margin_klines = margin_klines
+        self.mirror_row_bytes = mirror_row_bytes
+        self.buffers = {}      # (symbol, interval) -> DataFrame of recent klines
+        self.buffer_sizes = {} # (symbol, interval) -> rows kept
+        self.columns = {}      # (symbol, interval) -> tuple of columns kept, None for all
+        self.margin_in_effect = margin_klines
+        self.over_budget = False # True when even the consumers' minimums exceed the budget
+        self._requirements = {} # (symbol, interval) -> {consumer: (num_klines, columns)}
+
+    def add_market(self, symbol: str, interval: str, num_klines: int, initial_klines: pd.DataFrame = None,
+                   columns: tuple = None, consumer: str = None) -> None:
+        """
+        Registers what a consumer needs from a market: its `num_klines` most recent klines and
+        the kline `columns` it reads (None for all). Calling again for the same consumer replaces
+        its previous requirement. `initial_klines` seeds the buffer if it holds more than it has.
+        """
+        self._register((symbol, interval), consumer, num_klines, columns)
+        self._apply_budget()
+        self._seed((symbol, interval), initial_klines)
+
+    def add_strategy(self, strategy, interval: str, initial_klines: pd.DataFrame = None) -> None:
+        """Registers (or updates) a strategy's required_klines() and required_columns() for its market."""
+        self.add_market(strategy.symbol, interval, strategy.required_klines() or 0, initial_klines,
+                        columns=strategy.required_columns(), consumer=strategy.strategy_id)
+
+    def add_strategies(self, strategies: list, interval: str) -> None:
+        """
+        Registers (or updates) several strategies like add_strategy(), seeding each market from
+        the strategies' current_klines, but re-sizes the buffers once for the whole batch rather
+        than once per strategy.
+        """
+        for strategy in strategies:
+            self._register((strategy.symbol, interval), strategy.strategy_id, strategy.required_klines() or 0,
+                           strategy.required_columns())
+        self._apply_budget()
+        for strategy in strategies:
+            self._seed((strategy.symbol, interval), strategy.current_klines)
+
+    def markets(self) -> list:
+        return list(self.buffers)
+
+    def _row_bytes(self, market) -> int:
+        columns = self.columns.get(market)
+        row_bytes = _FULL_ROW_BYTES if columns is None else _COLUMN_BYTES * (len(columns) + 1)
+        return row_bytes + self.mirror_row_bytes
+
+    def _apply_budget(self) -> None:
+        """Recomputes every market's columns and retention, and trims buffers that shrank."""
+        needs = {}
+        for market, requirements in self._requirements.items():
+            needs[market] = max(num_klines for num_klines, _ in requirements.values())
+            column_sets = [columns for _, columns in requirements.values()]
+            if any(columns is None for columns in column_sets):
+                self.columns[market] = None
+            else:
+                self.columns[market] = tuple(sorted(set().union(*column_sets)))
+
+        margin = self.margin_klines
+        over_budget = False
+        if self.memory_budget_bytes is not None:
+            min_bytes = sum(num_klines * self._row_bytes(market) for market, num_klines in needs.items())
+            margin_bytes = sum(margin * self._row_bytes(market) for market in needs)
+            if min_bytes > self.memory_budget_bytes:
+                margin = 0
+                over_budget = True
+                if not self.over_budget:
+                    logger.error(f"KlineFeed: {len(needs)} markets need at least {min_bytes / _MB:.1f} MB of klines, "
+                                 f"over the {self.memory_budget_bytes / _MB:.1f} MB budget. Keeping only the "
+                                 f"required klines; raise the budget or track fewer markets.")
+            elif min_bytes + margin_bytes > self.memory_budget_bytes:
+                margin = int(margin * (self.memory_budget_bytes - min_bytes) / margin_bytes)
+        self.over_budget = over_budget
+        if margin != self.margin_in_effect:
+            logger.warning(f"KlineFeed: kline margin {self.margin_in_effect} -> {margin} "
+                           f"(configured {self.margin_klines}) to fit {len(needs)} markets in the memory budget.")
+            self.margin_in_effect = margin
+
+        for market, num_klines in needs.items():
+            self.buffer_sizes[market] = max(1, num_klines + margin)
+            buffer_df = self.buffers.get(market)
+            if buffer_df is not None and not buffer_df.empty:
+                self.buffers[market] = self._fit(market, buffer_df)
+
+    def _register(self, market, consumer: str, num_klines: int, columns: tuple = None) -> None:
+        self._requirements.setdefault(market, {})[consumer] = (num_klines, tuple(columns) if columns is not None else None)
+
+    def _seed(self, market, initial_klines: pd.DataFrame = None) -> None:
+        """Creates the market's buffer, from `initial_klines` if they hold more than it has."""
+        current = self.buffers.get(market)
+        if initial_klines is not None and (current is None or len(initial_klines) > len(current)):
+            self.buffers[market] = self._fit(market, initial_klines)
+        self.buffers.setdefault(market, pd.DataFrame())
+
+    def _project(self, market, klines_df: pd.DataFrame) -> pd.DataFrame:
+        columns = self.columns.get(market)
+        if columns is None:
+            return klines_df
+        keep = [col for col in klines_df.columns if col in columns]
+        if len(keep) == len(klines_df.columns):
+            return klines_df
+        return klines_df[keep]
+
+    def _fit(self, market, klines_df: pd.DataFrame) -> pd.DataFrame:
+        """Drops unused columns and all but the retained rows."""
+        klines_df = self._project(market, klines_df)
+        if len(klines_df) > self.buffer_sizes[market]:
+            # Copy so the trimmed rows are actually released, not kept alive by a view
+            klines_df = klines_df.iloc[-self.buffer_sizes[market]:].copy()
+        return klines_df
+
+    def last_open_ms(self, symbol: str, interval: str) -> int | None:
+        """Open time (epoch ms) of the newest buffered kline, or None if nothing is buffered."""
+        buffer_df = self.buffers.get((symbol, interval))
+        if buffer_df is None or buffer_df.empty:
+            return None
+        return int(buffer_df.index[-1:].values.astype('datetime64[ms]').astype('int64')[0])
+
+    async def publish(self, symbol: str, interval: str, klines_df: pd.DataFrame, close_ms: int = None) -> None:
+        """Merges new klines into the market's buffer and publishes a KlineEvent with the buffer."""
+        market = (symbol, interval)
+        if market not in self.buffers:
+            logger.debug(f"KlineFeed: no subscriber market for {symbol} {interval}; klines ignored.")
+            return
+        buffer_df = self.buffers[market]
+        if klines_df is not None and not klines_df.empty:
+            klines_df = self._project(market, klines_df)
+            if not buffer_df.empty:
+                klines_df = pd.concat([buffer_df, klines_df])
+                klines_df = klines_df[~klines_df.index.duplicated(keep='last')].sort_index()
+            buffer_df = self._fit(market, klines_df)
+            self.buffers[market] = buffer_df
+        await self.bus.publish(KlineEvent(symbol, interval, buffer_df, close_ms))
+
+    def memory_report(self) -> dict:
+        """
+        Bytes held by the kline buffers, per market and per symbol, against the budget.
+        Strategies fed from this feed share these buffers rather than holding copies; mirrors
+        (mirror_row_bytes per retained kline) are included in the per-symbol and total figures.
+        """
+        markets = {}
+        symbols = {}
+        for market, buffer_df in self.buffers.items():
+            nbytes = int(buffer_df.memory_usage(index=True, deep=True).sum())
+            mirror_bytes = self.buffer_sizes.get(market, 0) * self.mirror_row_bytes
+            markets[market] = {
+                'rows': len(buffer_df),
+                'retention': self.buffer_sizes.get(market, 0),
+                'columns': len(buffer_df.columns),
+                'bytes': nbytes,
+                'mirror_bytes': mirror_bytes,
+            }
+            symbols[market[0]] = symbols.get(market[0], 0) + nbytes + mirror_bytes
+        total = sum(symbols.values())
+        return {
+            'total_bytes': total,
+            'budget_bytes': self.memory_budget_bytes,
+            'margin_klines': self.margin_in_effect,
+            'markets': markets,
+            'symbols': symbols,
+        }
+
+    def log_memory_report(self, top: int = 10) -> None:
+        report = self.memory_report()
+        budget = report['budget_bytes']
+        budget_str = f"{budget / _MB:.1f} MB ({report['total_bytes'] / budget:.1%} used)" if budget else "unlimited"
+        logger.info(f"KlineFeed memory: {report['total_bytes'] / _MB:.3f} MB in {len(report['markets'])} markets "
+                    f"({len(report['symbols'])} symbols), budget {budget_str}, margin {report['margin_klines']} klines")
+        largest = sorted(report['symbols'].items(), key=lambda item: item[1], reverse=True)[:top]
+        for symbol, nbytes in largest:
+            logger.info(f"  {symbol}: {nbytes / 1024:.1f} kB")
@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod
 import pandas as pd
 import logging
 
+from .checkpoint import save_strategy_checkpoint, load_strategy_checkpoint
+
 logger = logging.getLogger(__name__) # Will be arbix_core.strategy.base_strategy
 
 class StrategySignal:
@@ -56,6 +58,29 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def required_columns(self) -> tuple | None:
+        """
+        Kline columns this strategy reads. Other columns are dropped from its buffer and from
+        the shared market data buffers. None (the default) keeps every column.
+        """
+        return None
+
+    def required_klines(self) -> int | None:
+        """
+        Minimum number of most recent klines the strategy needs to produce a signal.
+        Used to size the market data buffers; None means no known minimum.
+        """
+        return None
+
+    def _keep_required_columns(self, klines_df: pd.DataFrame) -> pd.DataFrame:
+        columns = self.required_columns()
+        if columns is None or klines_df.empty:
+            return klines_df
+        keep = [col for col in klines_df.columns if col in columns]
+        if len(keep) == len(klines_df.columns):
+            return klines_df # Already projected (e.g. by the KlineFeed); no copy
+        return klines_df[keep]
+
     def update_data(self, new_klines_df: pd.DataFrame) -> None:
         """
         Update the strategy's internal kline data.
@@ -65,11 +90,56 @@ class BaseStrategy(ABC):
         """
         if new_klines_df is not None and not new_klines_df.empty:
             # For simplicity now, we just assign. Later, we might append or combine.
-            self.current_klines = new_klines_df
+            self.current_klines = self._keep_required_columns(new_klines_df)
             logger.debug(f"Strategy [{self.strategy_id}] data updated for [{self.symbol}]. New klines count: {len(self.current_klines)}")
         else:
             logger.warning(f"Strategy [{self.strategy_id}] received empty or None data for [{self.symbol}].")
 
+    def append_data(self, new_klines_df: pd.DataFrame, max_rows: int = None) -> None:
+        """
+        Merge newer klines into the strategy's buffer instead of replacing it.
+        Rows with an open_time already in the buffer (e.g. the still-forming candle)
+        are overwritten by the new data.
+        :param max_rows: Optional cap on the number of most recent klines kept.
+        """
+        if new_klines_df is None or new_klines_df.empty:
+            logger.debug(f"Strategy [{self.strategy_id}] append_data: nothing new for [{self.symbol}].")
+            return
+        if self.current_klines.empty or (
+                new_klines_df.index[-1] >= self.current_klines.index[-1] and
+                (new_klines_df.index[0] <= self.current_klines.index[0] or
+                 (max_rows is not None and len(new_klines_df) >= max_rows))):
+            # The new frame covers everything the buffer would keep (e.g. a KlineFeed buffer):
+            # take it as is, so the strategy shares the feed's memory instead of holding a copy
+            merged = new_klines_df
+        else:
+            merged = pd.concat([self.current_klines, new_klines_df])
+            merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+        if max_rows is not None:
+            merged = merged.iloc[-max_rows:]
+        self.current_klines = self._keep_required_columns(merged)
+        logger.debug(f"Strategy [{self.strategy_id}] appended {len(new_klines_df)} klines for [{self.symbol}]. "
+                     f"Klines count: {len(self.current_klines)}")
+
+    def get_state(self) -> dict:
+        """
+        Strategy-specific state to include in checkpoints (must be JSON-serializable).
+        The kline buffer is saved separately. Override together with set_state().
+        """
+        return {}
+
+    def set_state(self, state: dict) -> None:
+        """Restore strategy-specific state produced by get_state()."""
+        pass
+
+    def save_checkpoint(self, path: str) -> bool:
+        """Snapshot the kline buffer and get_state() to `path` (written atomically)."""
+        return save_strategy_checkpoint(self, path)
+
+    def load_checkpoint(self, path: str) -> dict | None:
+        """Restore from a checkpoint written by save_checkpoint(). Returns its metadata, or None."""
+        return load_strategy_checkpoint(self, path)
+
 
     def run(self) -> StrategySignal | None:
         """
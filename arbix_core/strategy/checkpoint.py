@@ -0,0 +1,155 @@
+# arbix_core/strategy/checkpoint.py
+import json
+import logging
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__) # Will be arbix_core.strategy.checkpoint
+
+CHECKPOINT_VERSION = 1
+_META_KEY = '__meta__'
+_INDEX_KEY = '__index__'
+
+
+def _encode_column(series: pd.Series):
+    """Returns (array, kind) for a kline column, or (None, None) if it can't be stored compactly."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.to_numpy().astype('datetime64[ms]').astype(np.int64), 'datetime_ms'
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy(), 'numeric'
+    return None, None
+
+
+def save_strategy_checkpoint(strategy, path: str) -> bool:
+    """
+    Writes a snapshot of a strategy (kline buffer plus strategy.get_state()) to `path`.
+
+    The file is a NumPy .npz archive: one array per kline column and a JSON metadata block.
+    It is written to a temporary file in the same directory and moved into place with
+    os.replace, so a crash mid-write never leaves a truncated checkpoint behind.
+
+    :return: True if the checkpoint was written.
+    """
+    klines = strategy.current_klines
+    arrays = {}
+    columns = {}
+    for col in klines.columns:
+        values, kind = _encode_column(klines[col])
+        if values is None:
+            logger.warning(f"Checkpoint for [{strategy.strategy_id}]: column '{col}' ({klines[col].dtype}) not stored.")
+            continue
+        arrays[f"col_{len(columns)}"] = values
+        columns[col] = kind
+
+    if isinstance(klines.index, pd.DatetimeIndex):
+        arrays[_INDEX_KEY] = klines.index.values.astype('datetime64[ms]').astype(np.int64)
+    else:
+        arrays[_INDEX_KEY] = np.arange(len(klines), dtype=np.int64)
+
+    meta = {
+        'version': CHECKPOINT_VERSION,
+        'strategy_class': strategy.get_name(),
+        'strategy_id': strategy.strategy_id,
+        'symbol': strategy.symbol,
+        'config': strategy.config,
+        'saved_at_ms': int(time.time() * 1000),
+        'index_name': klines.index.name,
+        'columns': columns,
+        'state': strategy.get_state(),
+    }
+    arrays[_META_KEY] = np.frombuffer(json.dumps(meta, default=str).encode('utf-8'), dtype=np.uint8)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.ckpt-', suffix='.npz', dir=directory)
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        logger.debug(f"Checkpoint for [{strategy.strategy_id}] written to {path} ({len(klines)} klines).")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to write checkpoint for [{strategy.strategy_id}] to {path}: {e}", exc_info=True)
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+
+def load_strategy_checkpoint(strategy, path: str) -> dict | None:
+    """
+    Restores a strategy from a checkpoint written by save_strategy_checkpoint.
+
+    Nothing is applied unless the whole file loads and matches the strategy (same class,
+    strategy_id and symbol), so a failed restore leaves the strategy untouched.
+
+    :return: The checkpoint metadata (including 'saved_at_ms') if restored, otherwise None.
+    """
+    if not os.path.exists(path):
+        logger.info(f"No checkpoint found for [{strategy.strategy_id}] at {path}.")
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as archive:
+            meta = json.loads(archive[_META_KEY].tobytes().decode('utf-8'))
+            if meta.get('version') != CHECKPOINT_VERSION:
+                logger.warning(f"Checkpoint {path} has unsupported version {meta.get('version')}; ignoring it.")
+                return None
+            if (meta['strategy_class'], meta['strategy_id'], meta['symbol']) != \
+                    (strategy.get_name(), strategy.strategy_id, strategy.symbol):
+                logger.warning(f"Checkpoint {path} belongs to {meta['strategy_class']} [{meta['strategy_id']}] "
+                               f"on {meta['symbol']}; not restoring into [{strategy.strategy_id}].")
+                return None
+
+            data = {}
+            for i, (col, kind) in enumerate(meta['columns'].items()):
+                values = archive[f"col_{i}"]
+                data[col] = pd.to_datetime(values, unit='ms') if kind == 'datetime_ms' else values
+            index = pd.to_datetime(archive[_INDEX_KEY], unit='ms')
+    except Exception as e:
+        logger.error(f"Failed to read checkpoint {path} for [{strategy.strategy_id}]: {e}", exc_info=True)
+        return None
+
+    klines = pd.DataFrame(data, index=index)
+    klines.index.name = meta.get('index_name')
+    strategy.current_klines = klines
+    strategy.set_state(meta.get('state') or {})
+    age_s = (time.time() * 1000 - meta['saved_at_ms']) / 1000
+    logger.info(f"Restored [{strategy.strategy_id}] from checkpoint {path}: {len(klines)} klines, "
+                f"saved {age_s:.0f}s ago.")
+    return meta
+
+
+class CheckpointManager:
+    """
+    Periodically snapshots strategies into one file per strategy_id inside a directory.
+    Call maybe_save() after each strategy run; it only writes once `interval_seconds` has passed.
+    """
+
+    def __init__(self, directory: str = 'data/checkpoints', interval_seconds: float = 60.0):
+        self.directory = directory
+        self.interval_seconds = interval_seconds
+        self._last_saved = {} # strategy_id -> time.monotonic() of last write
+
+    def path_for(self, strategy) -> str:
+        return os.path.join(self.directory, f"{strategy.strategy_id}.npz")
+
+    def save(self, strategy) -> bool:
+        saved = save_strategy_checkpoint(strategy, self.path_for(strategy))
+        if saved:
+            self._last_saved[strategy.strategy_id] = time.monotonic()
+        return saved
+
+    def maybe_save(self, strategy) -> bool:
+        last = self._last_saved.get(strategy.strategy_id)
+        if last is not None and time.monotonic() - last < self.interval_seconds:
+            return False
+        return self.save(strategy)
+
+    def restore(self, strategy) -> dict | None:
+        return load_strategy_checkpoint(strategy, self.path_for(strategy))
@@ -2,17 +2,7 @@
 import pandas as pd
 import logging
 from .base_strategy import BaseStrategy, StrategySignal
-
-# Attempt to import 'ta' library, fall back to basic pandas rolling if not available
-try:
-    from ta.trend import SMAIndicator
-    TA_AVAILABLE = True
-except ImportError:
-    TA_AVAILABLE = False
-    logger = logging.getLogger(__name__) # Define logger if ta fails, base_strategy already defines it
-    logger.warning("The 'ta' library is not installed. SMA calculations will use basic pandas rolling mean. "
-                   "Install with 'pip install ta'.")
-
+from . import indicators
 
 logger = logging.getLogger(__name__) # Will be arbix_core.strategy.example_strategy
 
@@ -31,9 +21,13 @@ class SMACrossoverStrategy(BaseStrategy):
         
         if self.short_window >= self.long_window:
             raise ValueError("Short window must be less than long window for SMA Crossover.")
+
+        # Which side the short SMA was on at the last evaluated candle ("ABOVE"/"BELOW"/"EQUAL"), kept across
+        # restarts; generate_signal() compares the latest candle against it
+        self.last_crossover_state = None
         
         logger.info(f"SMACrossoverStrategy [{self.strategy_id}] for [{self.symbol}] initialized with "
-                    f"short_window={self.short_window}, long_window={self.long_window}. TA library available: {TA_AVAILABLE}")
+                    f"short_window={self.short_window}, long_window={self.long_window}.")
 
     def calculate_indicators(self, klines_df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -49,17 +43,9 @@ class SMACrossoverStrategy(BaseStrategy):
             logger.error(f"Strategy [{self.strategy_id}] for [{self.symbol}]: 'close' column is missing or not numeric.")
             return pd.DataFrame() # Return empty df to signal error
 
-        if TA_AVAILABLE:
-            # Using 'ta' library
-            sma_short_indicator = SMAIndicator(close=klines_df['close'], window=self.short_window, fillna=False)
-            klines_df[f'sma_short_{self.short_window}'] = sma_short_indicator.sma_indicator()
-
-            sma_long_indicator = SMAIndicator(close=klines_df['close'], window=self.long_window, fillna=False)
-            klines_df[f'sma_long_{self.long_window}'] = sma_long_indicator.sma_indicator()
-        else:
-            # Using basic pandas rolling mean
-            klines_df[f'sma_short_{self.short_window}'] = klines_df['close'].rolling(window=self.short_window).mean()
-            klines_df[f'sma_long_{self.long_window}'] = klines_df['close'].rolling(window=self.long_window).mean()
+        close = klines_df['close'].to_numpy()
+        klines_df[f'sma_short_{self.short_window}'] = indicators.sma(close, self.short_window)
+        klines_df[f'sma_long_{self.long_window}'] = indicators.sma(close, self.long_window)
         
         logger.debug(f"Strategy [{self.strategy_id}] for [{self.symbol}]: SMAs calculated. "
                      f"Last short SMA: {klines_df[f'sma_short_{self.short_window}'].iloc[-1]}, "
@@ -69,7 +55,8 @@ class SMACrossoverStrategy(BaseStrategy):
     def generate_signal(self, klines_with_indicators: pd.DataFrame) -> StrategySignal:
         """
         Generates BUY or SELL signal based on SMA crossover.
-        Looks at the last two candles to confirm a crossover.
+        Compares the latest candle with the side recorded at the last evaluated candle
+        (last_crossover_state), falling back to the previous candle when no side is known.
         """
         signal_type = "NO_SIGNAL"
         details = {}
@@ -82,36 +69,40 @@ class SMACrossoverStrategy(BaseStrategy):
             logger.error(f"Strategy [{self.strategy_id}] for [{self.symbol}]: SMA columns not found in DataFrame. Cannot generate signal.")
             return StrategySignal("NO_SIGNAL", self.symbol, {"reason": "SMA columns missing"})
 
-        # Need at least 2 rows to check for a crossover from the previous period
-        if len(klines_with_indicators) < 2:
-            logger.warning(f"Strategy [{self.strategy_id}] for [{self.symbol}]: Not enough data rows ({len(klines_with_indicators)}) "
-                           f"to check for crossover. Need at least 2.")
-            return StrategySignal("NO_SIGNAL", self.symbol, {"reason": "Insufficient rows for crossover check"})
-
-        # Get the last two rows for crossover detection
         # .iloc[-1] is the current (latest) candle
-        # .iloc[-2] is the previous candle
         last_row = klines_with_indicators.iloc[-1]
-        prev_row = klines_with_indicators.iloc[-2]
-
-        # Check for NaN values in SMAs for the relevant rows
-        if pd.isna(last_row[short_sma_col]) or pd.isna(last_row[long_sma_col]) or \
-           pd.isna(prev_row[short_sma_col]) or pd.isna(prev_row[long_sma_col]):
-            logger.warning(f"Strategy [{self.strategy_id}] for [{self.symbol}]: NaN values in SMAs for last or previous period. Cannot generate signal.")
+        if pd.isna(last_row[short_sma_col]) or pd.isna(last_row[long_sma_col]):
+            logger.warning(f"Strategy [{self.strategy_id}] for [{self.symbol}]: NaN values in SMAs for last period. Cannot generate signal.")
             return StrategySignal("NO_SIGNAL", self.symbol, {"reason": "NaN in SMA values"})
 
         # Current candle values
         current_short_sma = last_row[short_sma_col]
         current_long_sma = last_row[long_sma_col]
 
-        # Previous candle values
-        prev_short_sma = prev_row[short_sma_col]
-        prev_long_sma = prev_row[long_sma_col]
+        # Previous side: the one stored at the last evaluated candle, if known. It survives
+        # checkpoint restores and parameter updates, and still sees a crossover when candles
+        # in between were never evaluated (conflated events, downtime before a warm restart).
+        prev_state = self.last_crossover_state
+        if prev_state is None:
+            # Need at least 2 rows to check for a crossover from the previous period
+            if len(klines_with_indicators) < 2:
+                logger.warning(f"Strategy [{self.strategy_id}] for [{self.symbol}]: Not enough data rows ({len(klines_with_indicators)}) "
+                               f"to check for crossover. Need at least 2.")
+                return StrategySignal("NO_SIGNAL", self.symbol, {"reason": "Insufficient rows for crossover check"})
+            # .iloc[-2] is the previous candle
+            prev_row = klines_with_indicators.iloc[-2]
+            if pd.isna(prev_row[short_sma_col]) or pd.isna(prev_row[long_sma_col]):
+                logger.warning(f"Strategy [{self.strategy_id}] for [{self.symbol}]: NaN values in SMAs for previous period. Cannot generate signal.")
+                self.last_crossover_state = self._crossover_side(current_short_sma, current_long_sma)
+                return StrategySignal("NO_SIGNAL", self.symbol, {"reason": "NaN in SMA values"})
+            prev_state = self._crossover_side(prev_row[short_sma_col], prev_row[long_sma_col])
+
+        self.last_crossover_state = self._crossover_side(current_short_sma, current_long_sma)
 
         # Bullish Crossover: Short SMA crosses above Long SMA
         # Previous: short <= long
         # Current:  short > long
-        if prev_short_sma <= prev_long_sma and current_short_sma > current_long_sma:
+        if prev_state != "ABOVE" and current_short_sma > current_long_sma:
             signal_type = "BUY"
             details['reason'] = f"Bullish Crossover: Short SMA ({current_short_sma:.4f}) crossed above Long SMA ({current_long_sma:.4f})"
             details['price_at_signal'] = last_row['close'] # Signal based on close of current candle
@@ -122,7 +113,7 @@ class SMACrossoverStrategy(BaseStrategy):
         # Bearish Crossover: Short SMA crosses below Long SMA
         # Previous: short >= long
         # Current:  short < long
-        elif prev_short_sma >= prev_long_sma and current_short_sma < current_long_sma:
+        elif prev_state != "BELOW" and current_short_sma < current_long_sma:
             signal_type = "SELL" # For futures, this could mean open SHORT position
             details['reason'] = f"Bearish Crossover: Short SMA ({current_short_sma:.4f}) crossed below Long SMA ({current_long_sma:.4f})"
             details['price_at_signal'] = last_row['close']
@@ -137,4 +128,68 @@ class SMACrossoverStrategy(BaseStrategy):
             # logger.debug(f"Strategy [{self.strategy_id}] for [{self.symbol}]: HOLD signal. {details['reason']}")
 
 
-        return StrategySignal(signal_type, self.symbol, details)
\ No newline at end of file
+        return StrategySignal(signal_type, self.symbol, details)
+
+    @staticmethod
+    def _crossover_side(short_sma: float, long_sma: float) -> str:
+        """Which side of the long SMA the short SMA is on: "ABOVE", "BELOW" or "EQUAL"."""
+        if short_sma > long_sma:
+            return "ABOVE"
+        return "BELOW" if short_sma < long_sma else "EQUAL"
+
+    def required_columns(self) -> tuple:
+        return ('close',)
+
+    def required_klines(self) -> int:
+        # The crossover check compares the last two candles, both with a complete long SMA
+        return self.long_window + 1
+
+    def update_parameters(self, short_window: int = None, long_window: int = None) -> bool:
+        """
+        Applies new SMA windows to the running strategy without refetching data.
+        last_crossover_state, which generate_signal() compares the next candle against, is
+        re-derived for the new windows at the latest kline in memory, so a side computed with
+        the old windows can't produce a spurious crossover.
+        :return: True if the new parameters were applied.
+        """
+        new_short = self.short_window if short_window is None else short_window
+        new_long = self.long_window if long_window is None else long_window
+        if new_short >= new_long:
+            logger.error(f"Strategy [{self.strategy_id}]: rejected parameter update short_window={new_short}, "
+                         f"long_window={new_long}. Short window must be less than long window.")
+            return False
+        if (new_short, new_long) == (self.short_window, self.long_window):
+            return False
+
+        close = self.current_klines['close'].to_numpy() if 'close' in self.current_klines.columns else None
+        short_sma = long_sma = None
+        if close is not None and len(close) >= new_long:
+            # The SMA columns are rebuilt on every run; the only state to carry over is the
+            # crossover side at the latest candle, which needs just the latest value of each SMA
+            short_sma = close[-new_short:].mean()
+            long_sma = close[-new_long:].mean()
+        elif close is not None:
+            logger.warning(f"Strategy [{self.strategy_id}]: only {len(close)} klines in memory, long_window={new_long} "
+                           f"needs more; signals resume once enough candles have accumulated.")
+
+        self.short_window, self.long_window = new_short, new_long
+        self.config['short_window'], self.config['long_window'] = new_short, new_long
+        if short_sma is not None and long_sma is not None:
+            self.last_crossover_state = self._crossover_side(short_sma, long_sma)
+        else:
+            self.last_crossover_state = None # generate_signal() falls back to the previous candle
+        logger.info(f"Strategy [{self.strategy_id}] for [{self.symbol}]: parameters updated to "
+                    f"short_window={new_short}, long_window={new_long}. Crossover state: {self.last_crossover_state}")
+        return True
+
+    def get_state(self) -> dict:
+        return {
+            'short_window': self.short_window,
+            'long_window': self.long_window,
+            'last_crossover_state': self.last_crossover_state,
+        }
+
+    def set_state(self, state: dict) -> None:
+        # The crossover side is only meaningful for the windows it was computed with
+        if state.get('short_window') == self.short_window and state.get('long_window') == self.long_window:
+            self.last_crossover_state = state.get('last_crossover_state')
\ No newline at end of file
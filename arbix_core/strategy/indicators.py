@@ -0,0 +1,363 @@
+# arbix_core/strategy/indicators.py
+"""
+Technical indicators for strategies.
+
+Every indicator comes in two forms that produce the same numbers (up to floating point rounding):
+- a batch function working on NumPy arrays, for computing over a whole kline history at once;
+- a streaming class with an update() method, for feeding live candles one at a time.
+
+Batch functions return float64 arrays aligned with their input, with NaN until the indicator
+has enough data (the same warm-up convention as the 'ta' library with fillna=False).
+Streaming update() calls return the latest value, NaN while warming up.
+
+NaN inputs (missing candles): window indicators (SMA, Bollinger, VWAP) are NaN while a NaN is
+inside their window; recursive ones (EMA, RSI, ATR, MACD) carry the previous input forward.
+Leading NaNs are skipped. Both forms, with or without scipy, behave the same way.
+"""
+from collections import deque
+import math
+
+import numpy as np
+import pandas as pd
+
+# scipy's lfilter runs the exponential recursion in C; pandas' ewm is the fallback
+try:
+    from scipy.signal import lfilter
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+def _as_float_array(values) -> np.ndarray:
+    if isinstance(values, pd.Series):
+        values = values.to_numpy()
+    return np.asarray(values, dtype=np.float64)
+
+
+def _check_window(window: int) -> None:
+    if window < 1:
+        raise ValueError(f"Indicator window must be >= 1, got {window}.")
+
+
+def _ffill(values: np.ndarray) -> np.ndarray:
+    """Replaces NaN with the previous value; leading NaNs stay NaN."""
+    if not np.isnan(values).any():
+        return values
+    return pd.Series(values).ffill().to_numpy()
+
+
+def _first_valid(values: np.ndarray) -> int:
+    """Index of the first non-NaN value (len(values) if there is none)."""
+    valid = ~np.isnan(values)
+    return int(np.argmax(valid)) if valid.any() else len(values)
+
+
+def _ewm(values: np.ndarray, alpha: float, min_periods: int) -> np.ndarray:
+    """
+    Recursive exponential average y[t] = (1 - alpha) * y[t-1] + alpha * x[t], seeded with the
+    first non-NaN x. NaN inputs are forward-filled first, so the scipy and pandas paths agree.
+    """
+    out = np.full(len(values), np.nan)
+    first = _first_valid(values)
+    if first == len(values):
+        return out
+    values = _ffill(values[first:])
+    if SCIPY_AVAILABLE:
+        smoothed = lfilter([alpha], [1.0, alpha - 1.0], values, zi=[(1.0 - alpha) * values[0]])[0]
+    else:
+        smoothed = pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy(copy=True)
+    smoothed[:min_periods - 1] = np.nan
+    out[first:] = smoothed
+    return out
+
+
+# --- Batch kernels ---
+
+def sma(close, window: int) -> np.ndarray:
+    """Simple moving average."""
+    _check_window(window)
+    close = _as_float_array(close)
+    # pandas' rolling sum is compensated (Kahan) and exact on constant runs; differencing a
+    # running cumsum is not, and its rounding noise flipped SMA crossovers on flat prices
+    return pd.Series(close).rolling(window).mean().to_numpy(copy=True)
+
+
+def ema(close, window: int) -> np.ndarray:
+    """Exponential moving average with alpha = 2 / (window + 1)."""
+    _check_window(window)
+    return _ewm(_as_float_array(close), 2.0 / (window + 1), window)
+
+
+def _gains_losses(close: np.ndarray) -> tuple:
+    diff = np.diff(close, prepend=close[0]) if len(close) else close
+    return np.where(diff > 0, diff, 0.0), np.where(diff < 0, -diff, 0.0)
+
+
+def _rsi_from_averages(avg_gain, avg_loss):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gain / avg_loss
+        return np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + rs))
+
+
+def rsi(close, window: int = 14) -> np.ndarray:
+    """Relative Strength Index using Wilder smoothing (alpha = 1 / window)."""
+    _check_window(window)
+    close = _as_float_array(close)
+    out = np.full(len(close), np.nan)
+    first = _first_valid(close)
+    gains, losses = _gains_losses(_ffill(close[first:]))
+    avg_gain = _ewm(gains, 1.0 / window, window)
+    avg_loss = _ewm(losses, 1.0 / window, window)
+    segment = _rsi_from_averages(avg_gain, avg_loss)
+    segment[np.isnan(avg_gain)] = np.nan
+    out[first:] = segment
+    return out
+
+
+def true_range(high, low, close) -> np.ndarray:
+    """True range; the first candle has no previous close and uses high - low."""
+    high, low, close = _as_float_array(high), _as_float_array(low), _as_float_array(close)
+    prev_close = np.roll(close, 1)
+    if len(close):
+        prev_close[0] = np.nan
+    return np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+
+def atr(high, low, close, window: int = 14) -> np.ndarray:
+    """Average True Range using Wilder smoothing (alpha = 1 / window)."""
+    _check_window(window)
+    high, low, close = (_ffill(_as_float_array(values)) for values in (high, low, close))
+    return _ewm(true_range(high, low, close), 1.0 / window, window)
+
+
+def bollinger(close, window: int = 20, num_std: float = 2.0) -> tuple:
+    """
+    Bollinger Bands with population standard deviation.
+
+    :return: (middle, upper, lower) arrays.
+    """
+    _check_window(window)
+    close = _as_float_array(close)
+    middle = sma(close, window)
+    std = np.full(len(close), np.nan)
+    if len(close) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(close, window)
+        std[window - 1:] = windows.std(axis=1)
+    return middle, middle + num_std * std, middle - num_std * std
+
+
+def macd(close, fast: int = 12, slow: int = 26, signal: int = 9) -> tuple:
+    """
+    MACD line (EMA fast - EMA slow), its signal line and the histogram.
+    The signal EMA starts at the first valid MACD value.
+
+    :return: (macd_line, signal_line, histogram) arrays.
+    """
+    if fast >= slow:
+        raise ValueError("MACD fast window must be less than slow window.")
+    close = _as_float_array(close)
+    macd_line = ema(close, fast) - ema(close, slow)
+    signal_line = np.full(len(close), np.nan)
+    if len(close) >= slow:
+        signal_line[slow - 1:] = ema(macd_line[slow - 1:], signal)
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def vwap(high, low, close, volume, window: int = 14) -> np.ndarray:
+    """Rolling volume weighted average price of the typical price (high + low + close) / 3."""
+    _check_window(window)
+    high, low, close = _as_float_array(high), _as_float_array(low), _as_float_array(close)
+    volume = _as_float_array(volume)
+    pv_mean = sma((high + low + close) / 3.0 * volume, window)
+    vol_mean = sma(volume, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(vol_mean != 0, pv_mean / vol_mean, np.nan)
+
+
+# --- Streaming indicators ---
+
+class StreamingIndicator:
+    """
+    Base for stateful indicators updated one closed candle at a time.
+    Subclasses implement update() and keep `value` holding the latest output.
+    """
+
+    def __init__(self):
+        self.value = math.nan
+        self.count = 0
+
+    @property
+    def ready(self) -> bool:
+        """True once the indicator has produced a non-NaN value."""
+        return not (isinstance(self.value, float) and math.isnan(self.value))
+
+    def update_many(self, *columns) -> float:
+        """Feeds a batch of candles (e.g. history on warm-up) and returns the last value."""
+        for row in zip(*columns):
+            self.update(*row)
+        return self.value
+
+
+class SMA(StreamingIndicator):
+    def __init__(self, window: int):
+        super().__init__()
+        _check_window(window)
+        self.window = window
+        self._values = deque(maxlen=window)
+
+    def update(self, close: float) -> float:
+        self._values.append(close)
+        self.count += 1
+        # Exactly rounded sum of the window each time: a running total drifts, which is
+        # enough to flip the sign of a short/long SMA difference on flat prices
+        self.value = math.fsum(self._values) / self.window if len(self._values) == self.window else math.nan
+        return self.value
+
+
+class _EWM(StreamingIndicator):
+    def __init__(self, alpha: float, min_periods: int):
+        super().__init__()
+        self.alpha = alpha
+        self.min_periods = min_periods
+        self._mean = math.nan
+        self._last_x = math.nan
+
+    def update(self, x: float) -> float:
+        if math.isnan(x):
+            if self.count == 0:
+                return self.value # Leading NaNs are skipped
+            x = self._last_x # Missing input: carry the previous one forward
+        self._last_x = x
+        if self.count == 0:
+            self._mean = x
+        else:
+            self._mean = (1.0 - self.alpha) * self._mean + self.alpha * x
+        self.count += 1
+        self.value = self._mean if self.count >= self.min_periods else math.nan
+        return self.value
+
+
+class EMA(_EWM):
+    def __init__(self, window: int):
+        _check_window(window)
+        super().__init__(2.0 / (window + 1), window)
+        self.window = window
+
+
+class RSI(StreamingIndicator):
+    def __init__(self, window: int = 14):
+        super().__init__()
+        _check_window(window)
+        self.window = window
+        self._avg_gain = _EWM(1.0 / window, window)
+        self._avg_loss = _EWM(1.0 / window, window)
+        self._prev_close = None
+
+    def update(self, close: float) -> float:
+        if math.isnan(close):
+            if self._prev_close is None:
+                return self.value # Leading NaNs are skipped
+            close = self._prev_close # Missing candle: no change
+        diff = 0.0 if self._prev_close is None else close - self._prev_close
+        self._prev_close = close
+        avg_gain = self._avg_gain.update(max(diff, 0.0))
+        avg_loss = self._avg_loss.update(max(-diff, 0.0))
+        self.count += 1
+        if math.isnan(avg_gain):
+            self.value = math.nan
+        else:
+            self.value = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        return self.value
+
+
+class ATR(StreamingIndicator):
+    def __init__(self, window: int = 14):
+        super().__init__()
+        _check_window(window)
+        self.window = window
+        self._avg_tr = _EWM(1.0 / window, window)
+        self._prev_close = None
+        self._last = (math.nan, math.nan, math.nan)
+
+    def update(self, high: float, low: float, close: float) -> float:
+        # Carry each missing input forward, as the batch atr() does
+        high, low, close = (last if math.isnan(x) else x for x, last in zip((high, low, close), self._last))
+        self._last = (high, low, close)
+        if math.isnan(high) or math.isnan(low) or math.isnan(close):
+            return self.value # Leading NaNs are skipped
+        tr = high - low
+        if self._prev_close is not None:
+            tr = max(tr, abs(high - self._prev_close), abs(low - self._prev_close))
+        self._prev_close = close
+        self.count += 1
+        self.value = self._avg_tr.update(tr)
+        return self.value
+
+
+class BollingerBands(StreamingIndicator):
+    def __init__(self, window: int = 20, num_std: float = 2.0):
+        super().__init__()
+        _check_window(window)
+        self.window = window
+        self.num_std = num_std
+        self._values = deque(maxlen=window)
+        self.upper = math.nan
+        self.lower = math.nan
+
+    def update(self, close: float) -> float:
+        """Updates the bands and returns the middle band; upper/lower are attributes."""
+        self._values.append(close)
+        self.count += 1
+        if len(self._values) < self.window:
+            return self.value
+        # Recomputed over the window rather than with running sums to avoid variance drift
+        window_values = np.fromiter(self._values, dtype=np.float64, count=self.window)
+        middle = window_values.mean()
+        std = window_values.std()
+        self.value = middle
+        self.upper = middle + self.num_std * std
+        self.lower = middle - self.num_std * std
+        return self.value
+
+
+class MACD(StreamingIndicator):
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        super().__init__()
+        if fast >= slow:
+            raise ValueError("MACD fast window must be less than slow window.")
+        self._fast = EMA(fast)
+        self._slow = EMA(slow)
+        self._signal = EMA(signal)
+        self.signal = math.nan
+        self.histogram = math.nan
+
+    def update(self, close: float) -> float:
+        """Updates the MACD line and returns it; signal/histogram are attributes."""
+        fast = self._fast.update(close)
+        slow = self._slow.update(close)
+        self.count += 1
+        if math.isnan(slow):
+            return self.value
+        self.value = fast - slow
+        self.signal = self._signal.update(self.value)
+        self.histogram = self.value - self.signal
+        return self.value
+
+
+class VWAP(StreamingIndicator):
+    def __init__(self, window: int = 14):
+        super().__init__()
+        _check_window(window)
+        self.window = window
+        self._pv = SMA(window)
+        self._vol = SMA(window)
+
+    def update(self, high: float, low: float, close: float, volume: float) -> float:
+        pv_mean = self._pv.update((high + low + close) / 3.0 * volume)
+        vol_mean = self._vol.update(volume)
+        self.count += 1
+        if math.isnan(vol_mean):
+            self.value = math.nan
+        else:
+            self.value = pv_mean / vol_mean if vol_mean != 0 else math.nan
+        return self.value
@@ -0,0 +1,274 @@
+# arbix_core/strategy/sharded_runner.py
+import logging
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+
+import pandas as pd
+
+from .base_strategy import BaseStrategy, StrategySignal
+from arbix_core.utils.shared_klines import SharedKlineRing
+
+logger = logging.getLogger(__name__) # Will be arbix_core.strategy.sharded_runner
+
+
+def _worker_main(worker_index: int, strategy_specs: list, ring_names: dict, conn) -> None:
+    """
+    Entry point of a strategy worker process.
+
+    Builds its shard of strategies, attaches to the shared kline rings and then serves
+    'run' commands from the parent until told to stop. Only signals travel back over the pipe;
+    kline data is read straight from shared memory.
+    """
+    worker_logger = logging.getLogger(f"{__name__}.worker{worker_index}")
+    rings = {symbol: SharedKlineRing.attach(name, capacity) for symbol, (name, capacity) in ring_names.items()}
+    strategies = []
+    for strategy_cls, strategy_id, symbol, config in strategy_specs:
+        try:
+            strategies.append(strategy_cls(strategy_id, symbol, config))
+        except Exception as e:
+            worker_logger.error(f"Worker {worker_index}: failed to build strategy [{strategy_id}]: {e}", exc_info=True)
+
+    try:
+        while True:
+            try:
+                command = conn.recv()
+            except EOFError: # Parent went away
+                break
+            if command[0] == 'stop':
+                break
+            if command[0] != 'run':
+                worker_logger.warning(f"Worker {worker_index}: unknown command {command[0]!r} ignored.")
+                continue
+
+            cycle_id, symbols = command[1], command[2]
+            frames = {}
+            results = []
+            for strategy in strategies:
+                if symbols is not None and strategy.symbol not in symbols:
+                    continue
+                if strategy.symbol not in frames:
+                    frames[strategy.symbol] = rings[strategy.symbol].to_dataframe()
+                strategy.update_data(frames[strategy.symbol])
+                signal = strategy.run() # BaseStrategy.run already contains strategy exceptions
+                results.append((strategy.strategy_id, signal.signal_type, signal.symbol, signal.details))
+            conn.send(('signals', cycle_id, results))
+    finally:
+        for ring in rings.values():
+            ring.close()
+        conn.close()
+
+
+class ShardedStrategyRunner:
+    """
+    Runs strategy instances sharded across a pool of worker processes.
+
+    Market data is published once per symbol into a SharedKlineRing that every worker reads
+    directly; each worker talks to the parent over its own Pipe, so a worker that crashes only
+    loses its own shard for that cycle and is respawned before the next one. A worker that stops
+    answering is terminated and respawned after `max_missed_cycles` consecutive timeouts.
+
+    Strategies are registered as (class, strategy_id, symbol, config) and constructed inside
+    the workers, so the classes must be importable at module level.
+    """
+
+    def __init__(self, num_workers: int = None, ring_capacity: int = 1000, mp_context: str = None,
+                 ring_capacities: dict = None, max_missed_cycles: int = 3):
+        """
+        :param num_workers: Number of worker processes (defaults to the CPU count).
+        :param ring_capacity: Candles retained per symbol in shared memory.
+        :param mp_context: Optional multiprocessing start method ('spawn', 'fork', 'forkserver').
+        :param ring_capacities: Optional per-symbol capacities overriding `ring_capacity`.
+        :param max_missed_cycles: Consecutive cycles a worker may leave unanswered before it is
+                                  considered hung and replaced.
+        """
+        self.num_workers = max(1, num_workers or os.cpu_count() or 1)
+        self.ring_capacity = ring_capacity
+        self.ring_capacities = dict(ring_capacities or {})
+        self._ctx = multiprocessing.get_context(mp_context)
+        self.start_method = self._ctx.get_start_method()
+        self.max_missed_cycles = max(1, max_missed_cycles)
+        self._specs = []
+        self._rings = {}
+        self._workers = [] # [process, parent_conn, shard_specs] per worker slot
+        self._missed_cycles = [] # Consecutive unanswered cycles per worker slot
+        self._cycle_id = 0
+        self._started = False
+
+    def add_strategy(self, strategy_cls: type, strategy_id: str, symbol: str, config: dict = None) -> None:
+        """Registers a strategy to be built inside a worker. Must be called before start()."""
+        if self._started:
+            raise RuntimeError("Strategies must be added before ShardedStrategyRunner.start().")
+        if not issubclass(strategy_cls, BaseStrategy):
+            raise TypeError(f"{strategy_cls!r} is not a BaseStrategy subclass.")
+        self._specs.append((strategy_cls, strategy_id, symbol, config or {}))
+
+    def start(self) -> None:
+        """Creates the shared kline rings and launches the worker processes."""
+        if self._started:
+            return
+        if not self._specs:
+            raise RuntimeError("No strategies registered with ShardedStrategyRunner.")
+
+        for symbol in sorted({spec[2] for spec in self._specs}):
+            self._rings[symbol] = SharedKlineRing.create(self.ring_capacities.get(symbol, self.ring_capacity))
+
+        num_workers = min(self.num_workers, len(self._specs))
+        shards = [self._specs[i::num_workers] for i in range(num_workers)] # Round-robin
+        self._workers = [[None, None, shard] for shard in shards]
+        self._missed_cycles = [0] * num_workers
+        for index in range(num_workers):
+            self._spawn_worker(index)
+        self._started = True
+        logger.info(f"ShardedStrategyRunner started {num_workers} workers for {len(self._specs)} strategies "
+                    f"across {len(self._rings)} symbols.")
+
+    def _spawn_worker(self, index: int) -> None:
+        shard = self._workers[index][2]
+        parent_conn, child_conn = self._ctx.Pipe(duplex=True)
+        ring_names = {symbol: (ring.name, ring.capacity) for symbol, ring in self._rings.items()
+                      if any(spec[2] == symbol for spec in shard)}
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(index, shard, ring_names, child_conn),
+            name=f"arbix-strategy-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close() # Parent keeps only its end so EOF is detected if the worker dies
+        self._workers[index][0] = process
+        self._workers[index][1] = parent_conn
+        self._missed_cycles[index] = 0
+
+    def _respawn_worker(self, index: int) -> None:
+        process, conn, shard = self._workers[index]
+        process.join(1.0) # Reap it; a worker whose pipe hit EOF is already on its way out
+        if process.is_alive():
+            process.terminate()
+            process.join(1.0)
+        logger.error(f"Strategy worker {index} died (exit code {process.exitcode}). "
+                     f"Respawning with {len(shard)} strategies.")
+        conn.close()
+        self._spawn_worker(index)
+
+    def _respawn_dead_workers(self) -> None:
+        for index, (process, _, _) in enumerate(self._workers):
+            if not process.is_alive():
+                self._respawn_worker(index)
+
+    def publish_klines(self, symbol: str, klines_df: pd.DataFrame) -> int:
+        """
+        Publishes candles for a symbol into its shared ring. Workers see them on the next cycle.
+
+        :return: Number of rows written.
+        """
+        ring = self._rings.get(symbol)
+        if ring is None:
+            logger.warning(f"ShardedStrategyRunner: no strategy registered for {symbol}, klines not published.")
+            return 0
+        return ring.publish(klines_df)
+
+    def shared_memory_bytes(self) -> int:
+        """Total size of the shared kline rings."""
+        return sum(ring.nbytes for ring in self._rings.values())
+
+    def run_cycle(self, symbols: list = None, timeout: float = 10.0) -> dict:
+        """
+        Runs one evaluation cycle on all workers in parallel and collects their signals.
+
+        :param symbols: Optional list of symbols to evaluate; all registered strategies when None.
+        :param timeout: Seconds to wait for workers before giving up on the stragglers.
+        :return: Dict strategy_id -> StrategySignal for the strategies that answered.
+        """
+        if not self._started:
+            raise RuntimeError("ShardedStrategyRunner.start() must be called before run_cycle().")
+        self._respawn_dead_workers()
+        self._cycle_id += 1
+        cycle_id = self._cycle_id
+        wanted = set(symbols) if symbols is not None else None
+
+        pending = {}
+        for index, (process, conn, shard) in enumerate(self._workers):
+            if wanted is not None and not any(spec[2] in wanted for spec in shard):
+                continue
+            try:
+                conn.send(('run', cycle_id, wanted))
+            except (BrokenPipeError, OSError) as e:
+                logger.error(f"Strategy worker {index} unreachable: {e}")
+                self._respawn_worker(index)
+                conn = self._workers[index][1]
+                try:
+                    conn.send(('run', cycle_id, wanted))
+                except (BrokenPipeError, OSError) as e:
+                    # Don't let one bad shard fail the cycle; it gets respawned again before the next one
+                    logger.error(f"Respawned strategy worker {index} unreachable: {e}; skipping its shard this cycle.")
+                    continue
+            pending[conn] = index
+
+        signals = {}
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.error(f"ShardedStrategyRunner cycle {cycle_id}: workers {sorted(pending.values())} "
+                             f"did not answer within {timeout}s.")
+                self._replace_hung_workers(pending.values())
+                break
+            for conn in wait(list(pending), timeout=remaining):
+                index = pending.pop(conn)
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    logger.error(f"Strategy worker {index} crashed during cycle {cycle_id}; its signals are lost for this cycle.")
+                    self._respawn_worker(index)
+                    continue
+                kind, answered_cycle, results = message
+                if kind != 'signals' or answered_cycle != cycle_id:
+                    # Late answer to a previous (timed out) cycle; keep waiting for the current one
+                    pending[conn] = index
+                    continue
+                self._missed_cycles[index] = 0
+                for strategy_id, signal_type, symbol, details in results:
+                    signals[strategy_id] = StrategySignal(signal_type, symbol, details)
+        return signals
+
+    def _replace_hung_workers(self, indexes) -> None:
+        """Counts a missed cycle for each worker; terminates and respawns those over the limit."""
+        for index in indexes:
+            self._missed_cycles[index] += 1
+            if self._missed_cycles[index] < self.max_missed_cycles:
+                continue
+            # A hung worker is still alive, so _respawn_dead_workers() would never replace it
+            logger.error(f"Strategy worker {index} missed {self._missed_cycles[index]} consecutive cycles; terminating it.")
+            self._workers[index][0].terminate()
+            self._respawn_worker(index)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stops the workers and frees the shared memory."""
+        for process, conn, _ in self._workers:
+            try:
+                conn.send(('stop',))
+            except (BrokenPipeError, OSError):
+                pass
+        for process, conn, _ in self._workers:
+            process.join(timeout)
+            if process.is_alive():
+                logger.warning(f"Strategy worker {process.name} did not stop in time; terminating.")
+                process.terminate()
+                process.join(timeout)
+            conn.close()
+        self._workers = []
+        for ring in self._rings.values():
+            ring.close()
+            ring.unlink()
+        self._rings = {}
+        self._started = False
+        logger.info("ShardedStrategyRunner stopped.")
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
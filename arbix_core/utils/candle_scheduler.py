@@ -0,0 +1,81 @@
+# arbix_core/utils/candle_scheduler.py
+import asyncio
+import logging
+import statistics
+from collections import deque
+
+from arbix_core.utils.time_utils import next_kline_open_ms, now_ms
+
+logger = logging.getLogger(__name__) # Will be arbix_core.utils.candle_scheduler
+
+
+class CandleCloseScheduler:
+    """
+    Wakes up right after each exchange candle closes, on the exchange's clock.
+
+    Close times are computed in server time (via ClockSync) and converted back to the local
+    clock for sleeping, so evaluation is triggered at close + safety_margin_ms regardless of
+    local clock drift. The observed close-to-evaluation lag is recorded for reporting.
+    """
+
+    def __init__(self, clock_sync, interval: str, safety_margin_ms: int = 50, lag_window: int = 500):
+        """
+        :param clock_sync: ClockSync providing the server clock offset (None means local clock).
+        :param interval: Kline interval, e.g. "1m" or "1M" (calendar month). Raises ValueError if unsupported.
+        :param safety_margin_ms: Delay after the close before firing, so the exchange has the candle finalized.
+        :param lag_window: Number of recent lag observations kept for the report.
+        """
+        self.clock_sync = clock_sync
+        self.interval = interval
+        next_kline_open_ms(interval, 0) # Validate the interval now rather than at the first wait
+        self.safety_margin_ms = safety_margin_ms
+        self._lags_ms = deque(maxlen=lag_window)
+
+    def _server_now_ms(self) -> int:
+        return self.clock_sync.server_time_ms() if self.clock_sync else now_ms()
+
+    def _local_for(self, server_ms: float) -> float:
+        return self.clock_sync.local_time_for(server_ms) if self.clock_sync else server_ms
+
+    def next_close_ms(self, server_ms: int = None) -> int:
+        """Server time of the next candle close (equal to the next candle's open time)."""
+        server_ms = self._server_now_ms() if server_ms is None else server_ms
+        return next_kline_open_ms(self.interval, server_ms)
+
+    async def wait_for_next_close(self) -> int:
+        """
+        Sleeps until the next candle close plus the safety margin.
+        :return: Server time (ms) of the close that was waited for.
+        """
+        close_ms = self.next_close_ms()
+        fire_at_server_ms = close_ms + self.safety_margin_ms
+        while True:
+            # Re-derive the local target each time round: the offset estimate may be refined while we sleep
+            remaining_ms = self._local_for(fire_at_server_ms) - now_ms()
+            if remaining_ms <= 0:
+                return close_ms
+            await asyncio.sleep(min(remaining_ms, 5000) / 1000)
+
+    def record_evaluation(self, close_ms: int) -> float:
+        """
+        Records that evaluation for the candle closing at `close_ms` has completed.
+        :return: The close-to-evaluation lag in milliseconds.
+        """
+        lag_ms = self._server_now_ms() - close_ms
+        self._lags_ms.append(lag_ms)
+        logger.debug(f"Candle close {close_ms} ({self.interval}) evaluated with lag {lag_ms:.0f}ms.")
+        return lag_ms
+
+    def lag_report(self) -> dict:
+        """Summary of observed close-to-evaluation lag in milliseconds."""
+        lags = sorted(self._lags_ms)
+        if not lags:
+            return {'count': 0}
+        return {
+            'count': len(lags),
+            'last_ms': self._lags_ms[-1],
+            'mean_ms': statistics.fmean(lags),
+            'p50_ms': lags[len(lags) // 2],
+            'p95_ms': lags[min(len(lags) - 1, int(len(lags) * 0.95))],
+            'max_ms': lags[-1],
+        }
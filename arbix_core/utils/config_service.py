@@ -0,0 +1,133 @@
+# arbix_core/utils/config_service.py
+import asyncio
+import configparser
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__) # Will be arbix_core.utils.config_service
+
+
+class ConfigService:
+    """
+    Single parsed copy of config.ini shared by all components.
+
+    Offers the same get/getint/getfloat/getboolean calls as ConfigParser, so callers can use
+    it in place of their own parser. watch() polls the file and, when it changes, reloads it
+    and notifies listeners subscribed to the sections whose values changed.
+    """
+
+    def __init__(self, config_path: str = 'config/config.ini'):
+        self.config_path = config_path
+        self._lock = threading.Lock()
+        self._listeners = {} # section -> [callback(section, changes)]
+        self._parser = self._read()
+        self._stamp = self._file_stamp()
+        logger.info(f"Configuration loaded from {config_path}.")
+
+    def _read(self) -> configparser.ConfigParser:
+        parser = configparser.ConfigParser()
+        if not parser.read(self.config_path):
+            logger.error(f"Configuration file {self.config_path} not found or unreadable.")
+            raise FileNotFoundError(f"Configuration file {self.config_path} not found.")
+        return parser
+
+    def _file_stamp(self):
+        try:
+            stat = os.stat(self.config_path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    @property
+    def config(self) -> configparser.ConfigParser:
+        """The current parsed configuration. Replaced (not mutated) on reload."""
+        return self._parser
+
+    def get(self, section: str, option: str, **kwargs):
+        return self._parser.get(section, option, **kwargs)
+
+    def getint(self, section: str, option: str, **kwargs):
+        return self._parser.getint(section, option, **kwargs)
+
+    def getfloat(self, section: str, option: str, **kwargs):
+        return self._parser.getfloat(section, option, **kwargs)
+
+    def getboolean(self, section: str, option: str, **kwargs):
+        return self._parser.getboolean(section, option, **kwargs)
+
+    def subscribe(self, section: str, callback) -> None:
+        """
+        Registers callback(section, changes) for reloads that change `section`.
+        `changes` maps option -> new value (None when the option was removed).
+        """
+        self._listeners.setdefault(section, []).append(callback)
+
+    @staticmethod
+    def _snapshot(parser: configparser.ConfigParser) -> dict:
+        sections = {'DEFAULT': dict(parser.defaults())}
+        for section in parser.sections():
+            sections[section] = dict(parser.items(section, raw=True))
+        return sections
+
+    def reload(self) -> dict:
+        """
+        Re-reads the file and notifies listeners. A file that fails to parse is ignored and
+        the previous configuration stays in effect.
+        :return: Dict section -> {option: new value} of what changed.
+        """
+        with self._lock:
+            try:
+                new_parser = self._read()
+            except (FileNotFoundError, configparser.Error) as e:
+                logger.error(f"Config reload failed, keeping previous configuration: {e}")
+                return {}
+            old, new = self._snapshot(self._parser), self._snapshot(new_parser)
+            self._parser = new_parser
+            self._stamp = self._file_stamp()
+
+        changed = {}
+        for section in set(old) | set(new):
+            old_items, new_items = old.get(section, {}), new.get(section, {})
+            diff = {option: new_items.get(option) for option in set(old_items) | set(new_items)
+                    if old_items.get(option) != new_items.get(option)}
+            if diff:
+                changed[section] = diff
+        if changed:
+            logger.info(f"Configuration reloaded from {self.config_path}; changed sections: {sorted(changed)}")
+        for section, diff in changed.items():
+            for callback in self._listeners.get(section, ()):
+                try:
+                    callback(section, diff)
+                except Exception as e:
+                    logger.error(f"Config listener for [{section}] failed: {e}", exc_info=True)
+        return changed
+
+    def check_for_changes(self) -> dict:
+        """Reloads if the file's modification time or size changed since the last load."""
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._stamp:
+            return {}
+        return self.reload()
+
+    async def watch(self, interval_seconds: float = 2.0) -> None:
+        """Polls the file for changes until cancelled. Listeners run in the event loop's thread."""
+        logger.info(f"Watching {self.config_path} for changes every {interval_seconds}s.")
+        while True:
+            await asyncio.sleep(interval_seconds)
+            self.check_for_changes()
+
+
+_services = {}
+_services_lock = threading.Lock()
+
+
+def get_config_service(config_path: str = 'config/config.ini') -> ConfigService:
+    """Returns the shared ConfigService for a file, loading it on first use."""
+    key = os.path.abspath(config_path)
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = ConfigService(config_path)
+            _services[key] = service
+        return service
@@ -0,0 +1,165 @@
+# arbix_core/utils/shared_klines.py
+import logging
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__) # Will be arbix_core.utils.shared_klines
+
+# Columns stored in the ring. open_time is kept as epoch milliseconds (exact in float64).
+RING_COLUMNS = ['open_time', 'open', 'high', 'low', 'close', 'volume']
+RING_ROW_BYTES = len(RING_COLUMNS) * 8 # float64 per column, whichever columns the publisher has
+
+# Header layout (int64 slots): sequence counter, rows currently held, next write position.
+_HDR_SEQ = 0
+_HDR_COUNT = 1
+_HDR_HEAD = 2
+_HDR_SLOTS = 8 # Padded so the data block starts on a 64-byte boundary
+
+
+class SharedKlineRing:
+    """
+    Fixed-capacity ring buffer of klines living in a shared memory block.
+
+    One process (the publisher) creates the ring and writes candles into it;
+    any number of worker processes attach by name and read the latest candles
+    without anything being pickled. Consistency between a writer and concurrent
+    readers is handled with a sequence lock: the writer makes the sequence odd
+    while it is writing and even when done, readers retry if it changed.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, capacity: int, owner: bool):
+        self._shm = shm
+        self.capacity = capacity
+        self.owner = owner
+        self._header = np.ndarray((_HDR_SLOTS,), dtype=np.int64, buffer=shm.buf, offset=0)
+        self._data = np.ndarray((capacity, len(RING_COLUMNS)), dtype=np.float64,
+                                buffer=shm.buf, offset=_HDR_SLOTS * 8)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def nbytes(self) -> int:
+        return self._size_for(self.capacity)
+
+    @staticmethod
+    def _size_for(capacity: int) -> int:
+        return _HDR_SLOTS * 8 + capacity * len(RING_COLUMNS) * 8
+
+    @classmethod
+    def create(cls, capacity: int, name: str = None) -> 'SharedKlineRing':
+        """
+        Allocates a new ring. The creating process owns it and must call unlink() when done.
+
+        :param capacity: Maximum number of candles retained (oldest are overwritten).
+        :param name: Optional shared memory block name; generated when omitted.
+        """
+        if capacity <= 0:
+            raise ValueError("SharedKlineRing capacity must be positive.")
+        shm = shared_memory.SharedMemory(name=name, create=True, size=cls._size_for(capacity))
+        ring = cls(shm, capacity, owner=True)
+        ring._header[:] = 0
+        logger.debug(f"SharedKlineRing [{ring.name}] created with capacity {capacity}.")
+        return ring
+
+    @classmethod
+    def attach(cls, name: str, capacity: int) -> 'SharedKlineRing':
+        """Attaches to an existing ring created by another process."""
+        shm = shared_memory.SharedMemory(name=name, create=False)
+        return cls(shm, capacity, owner=False)
+
+    def __len__(self) -> int:
+        return int(self._header[_HDR_COUNT])
+
+    def _last_open_time(self) -> float | None:
+        count = int(self._header[_HDR_COUNT])
+        if count == 0:
+            return None
+        last_pos = (int(self._header[_HDR_HEAD]) - 1) % self.capacity
+        return self._data[last_pos, 0]
+
+    def publish(self, klines_df: pd.DataFrame) -> int:
+        """
+        Writes candles from a klines DataFrame (as returned by BinanceConnector.get_futures_klines_df).
+        Candles older than the last stored one are ignored, a candle with the same open time
+        replaces the stored one (the still-forming candle), newer candles are appended.
+
+        :return: Number of rows written.
+        """
+        if klines_df is None or klines_df.empty:
+            return 0
+
+        open_times = klines_df.index
+        if isinstance(open_times, pd.DatetimeIndex):
+            open_ms = open_times.values.astype('datetime64[ms]').astype(np.int64)
+        else:
+            open_ms = np.asarray(open_times, dtype=np.int64)
+        rows = np.empty((len(klines_df), len(RING_COLUMNS)), dtype=np.float64)
+        rows[:, 0] = open_ms
+        for col_idx, col in enumerate(RING_COLUMNS[1:], start=1):
+            rows[:, col_idx] = klines_df[col].to_numpy(dtype=np.float64) if col in klines_df.columns else np.nan
+
+        last_open = self._last_open_time()
+        if last_open is not None:
+            rows = rows[rows[:, 0] >= last_open]
+        if len(rows) == 0:
+            return 0
+        rows = rows[-self.capacity - 1:] # Never need more than a full ring (+1 possible replacement)
+
+        header = self._header
+        header[_HDR_SEQ] += 1 # Odd: write in progress
+        head = int(header[_HDR_HEAD])
+        count = int(header[_HDR_COUNT])
+        start = 0
+        if last_open is not None and rows[0, 0] == last_open:
+            self._data[(head - 1) % self.capacity] = rows[0]
+            start = 1
+        for row in rows[start:]:
+            self._data[head] = row
+            head = (head + 1) % self.capacity
+            count = min(count + 1, self.capacity)
+        header[_HDR_HEAD] = head
+        header[_HDR_COUNT] = count
+        header[_HDR_SEQ] += 1 # Even: consistent again
+        return len(rows)
+
+    def read(self, max_retries: int = 100) -> np.ndarray:
+        """
+        Returns a consistent copy of the stored candles, oldest first, shape (n, len(RING_COLUMNS)).
+        """
+        header = self._header
+        for _ in range(max_retries):
+            seq_before = int(header[_HDR_SEQ])
+            if seq_before % 2:
+                continue
+            count = int(header[_HDR_COUNT])
+            head = int(header[_HDR_HEAD])
+            if count < self.capacity:
+                snapshot = self._data[:count].copy()
+            else:
+                snapshot = np.concatenate((self._data[head:], self._data[:head]))
+            if int(header[_HDR_SEQ]) == seq_before:
+                return snapshot
+        raise RuntimeError(f"SharedKlineRing [{self.name}]: could not get a consistent read after {max_retries} attempts.")
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Reads the ring into a DataFrame indexed by open_time, matching the connector's layout."""
+        snapshot = self.read()
+        df = pd.DataFrame(snapshot[:, 1:], columns=RING_COLUMNS[1:])
+        df.index = pd.to_datetime(snapshot[:, 0].astype(np.int64), unit='ms')
+        df.index.name = 'open_time'
+        return df
+
+    def close(self) -> None:
+        # Views into the buffer must be released before the block can be closed.
+        self._header = None
+        self._data = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Frees the shared memory block. Only the owner should call this."""
+        if self.owner:
+            self._shm.unlink()
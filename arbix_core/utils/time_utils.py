@@ -0,0 +1,69 @@
+# arbix_core/utils/time_utils.py
+import time
+from datetime import datetime, timezone
+
+# Binance kline interval suffixes in milliseconds
+_INTERVAL_UNITS_MS = {
+    's': 1000,
+    'm': 60 * 1000,
+    'h': 60 * 60 * 1000,
+    'd': 24 * 60 * 60 * 1000,
+    'w': 7 * 24 * 60 * 60 * 1000,
+}
+_WEEK_ALIGNMENT_MS = 4 * 24 * 60 * 60 * 1000
+
+
+def interval_to_ms(interval: str) -> int:
+    """
+    Converts a Binance kline interval (e.g. "1m", "15m", "4h", "1d") to milliseconds.
+    Monthly intervals ("1M") have no fixed length and are rejected; see next_kline_open_ms()
+    and candles_between() for calendar-aware arithmetic.
+    """
+    if not interval or interval[-1] not in _INTERVAL_UNITS_MS or not interval[:-1].isdigit():
+        raise ValueError(f"Unsupported kline interval: {interval!r}")
+    return int(interval[:-1]) * _INTERVAL_UNITS_MS[interval[-1]]
+
+
+def _parse_month_interval(interval: str) -> int | None:
+    """Number of months in a calendar-month interval ("1M"), or None for other intervals."""
+    if interval and interval[-1] == 'M' and interval[:-1].isdigit() and int(interval[:-1]) > 0:
+        return int(interval[:-1])
+    return None
+
+
+def _month_index(ms: int) -> int:
+    """Months since January 1970 (UTC) of an epoch-milliseconds timestamp."""
+    moment = datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+    return (moment.year - 1970) * 12 + moment.month - 1
+
+
+def _month_start_ms(month_index: int) -> int:
+    year, month = divmod(month_index, 12)
+    return int(datetime(1970 + year, month + 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def next_kline_open_ms(interval: str, ms: int) -> int:
+    """
+    Open time of the first candle opening strictly after `ms` (the close of the candle containing `ms`).
+    Handles calendar months ("1M"), and weeks opening on Monday 00:00 UTC like Binance's.
+    """
+    months = _parse_month_interval(interval)
+    if months is not None:
+        return _month_start_ms((_month_index(ms) // months + 1) * months)
+    interval_ms = interval_to_ms(interval)
+    # Binance weekly candles open on Monday 00:00 UTC; the Unix epoch was a Thursday.
+    alignment_ms = _WEEK_ALIGNMENT_MS if interval.endswith('w') else 0
+    return ms - (ms - alignment_ms) % interval_ms + interval_ms
+
+
+def candles_between(interval: str, open_ms: int, end_ms: int) -> int:
+    """Number of candles that opened after the candle opening at `open_ms`, up to `end_ms`."""
+    months = _parse_month_interval(interval)
+    if months is not None:
+        return max(0, (_month_index(end_ms) - _month_index(open_ms)) // months)
+    return max(0, (end_ms - open_ms) // interval_to_ms(interval))
+
+
+def now_ms() -> int:
+    """Current local wall-clock time in epoch milliseconds."""
+    return time.time_ns() // 1_000_000
@@ -0,0 +1,76 @@
+# benchmarks/bench_indicators.py
+# Compares arbix_core.strategy.indicators against constructing 'ta' indicator objects per run.
+# Run from the project root: python -m benchmarks.bench_indicators
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from arbix_core.strategy import indicators
+
+try:
+    import ta
+    TA_AVAILABLE = True
+except ImportError:
+    TA_AVAILABLE = False
+
+ROWS = 1000
+REPEATS = 200
+
+
+def _make_klines(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    close = 100 + np.cumsum(rng.standard_normal(rows))
+    return pd.DataFrame({
+        'high': close + rng.random(rows),
+        'low': close - rng.random(rows),
+        'close': close,
+        'volume': rng.random(rows) * 10,
+    })
+
+
+def _time_us(func) -> float:
+    return timeit.timeit(func, number=REPEATS) / REPEATS * 1e6
+
+
+def main():
+    df = _make_klines(ROWS)
+    high, low, close, volume = (df[col].to_numpy() for col in ('high', 'low', 'close', 'volume'))
+
+    cases = {
+        'SMA(50)': (lambda: indicators.sma(close, 50),
+                    lambda: ta.trend.SMAIndicator(df['close'], window=50).sma_indicator()),
+        'EMA(50)': (lambda: indicators.ema(close, 50),
+                    lambda: ta.trend.EMAIndicator(df['close'], window=50).ema_indicator()),
+        'RSI(14)': (lambda: indicators.rsi(close, 14),
+                    lambda: ta.momentum.RSIIndicator(df['close'], window=14).rsi()),
+        'ATR(14)': (lambda: indicators.atr(high, low, close, 14),
+                    lambda: ta.volatility.AverageTrueRange(df['high'], df['low'], df['close'], window=14).average_true_range()),
+        'Bollinger(20)': (lambda: indicators.bollinger(close, 20),
+                          lambda: ta.volatility.BollingerBands(df['close'], window=20).bollinger_hband()),
+        'MACD(12,26,9)': (lambda: indicators.macd(close),
+                          lambda: ta.trend.MACD(df['close']).macd_signal()),
+        'VWAP(14)': (lambda: indicators.vwap(high, low, close, volume, 14),
+                     lambda: ta.volume.VolumeWeightedAveragePrice(df['high'], df['low'], df['close'], df['volume'],
+                                                                 window=14).volume_weighted_average_price()),
+    }
+
+    print(f"{ROWS} candles, mean over {REPEATS} runs (microseconds)")
+    print(f"{'indicator':<15}{'arbix':>10}{'ta':>10}{'speedup':>10}")
+    for name, (ours, theirs) in cases.items():
+        ours_us = _time_us(ours)
+        if TA_AVAILABLE:
+            ta_us = _time_us(theirs)
+            print(f"{name:<15}{ours_us:>10.1f}{ta_us:>10.1f}{ta_us / ours_us:>9.1f}x")
+        else:
+            print(f"{name:<15}{ours_us:>10.1f}{'n/a':>10}{'':>10}")
+
+    stream = indicators.EMA(50)
+    stream.update_many(close)
+    print(f"Streaming EMA(50) update: {_time_us(lambda: stream.update(close[-1])):.2f} us per candle")
+    if not TA_AVAILABLE:
+        print("Install 'ta' to compare against it.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/bench_sharded.py
+# Measures evaluation cycles of N SMA strategies run inline (in this process) and on
+# ShardedStrategyRunner with 1 worker versus k workers. Speedups need as many free cores as
+# workers; on a single CPU the workers only add IPC overhead to the inline time.
+# Run from the project root: python -m benchmarks.bench_sharded [--strategies N] [--workers 1,2,4]
+import argparse
+import logging
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from arbix_core.strategy.example_strategy import SMACrossoverStrategy
+from arbix_core.strategy.sharded_runner import ShardedStrategyRunner
+
+SYMBOLS = 50
+KLINES = 1000
+CYCLES = 20
+STRATEGY_CONFIG = {'short_window': 50, 'long_window': 200}
+
+
+def _make_klines(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.standard_normal(rows))
+    index = pd.to_datetime(np.arange(rows, dtype=np.int64) * 60_000, unit='ms')
+    index.name = 'open_time'
+    return pd.DataFrame({'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+                         'volume': rng.random(rows) * 10}, index=index)
+
+
+def _strategy_specs(num_strategies: int) -> list:
+    return [(f"SMA_{i}", f"SYM{i % SYMBOLS}") for i in range(num_strategies)]
+
+
+def _bench_inline(specs: list, klines: dict) -> float:
+    strategies = [SMACrossoverStrategy(strategy_id, symbol, dict(STRATEGY_CONFIG)) for strategy_id, symbol in specs]
+    start = time.perf_counter()
+    for _ in range(CYCLES):
+        for strategy in strategies:
+            strategy.update_data(klines[strategy.symbol])
+            strategy.run()
+    return (time.perf_counter() - start) / CYCLES
+
+
+def _bench_sharded(specs: list, klines: dict, num_workers: int) -> float:
+    runner = ShardedStrategyRunner(num_workers=num_workers, ring_capacity=KLINES)
+    for strategy_id, symbol in specs:
+        runner.add_strategy(SMACrossoverStrategy, strategy_id, symbol, dict(STRATEGY_CONFIG))
+    with runner:
+        for symbol, klines_df in klines.items():
+            runner.publish_klines(symbol, klines_df)
+        runner.run_cycle() # Warm-up: workers finish importing and building their strategies
+        start = time.perf_counter()
+        for _ in range(CYCLES):
+            signals = runner.run_cycle(timeout=60.0)
+        elapsed = (time.perf_counter() - start) / CYCLES
+    if len(signals) != len(specs):
+        print(f"  warning: only {len(signals)}/{len(specs)} strategies answered")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inline vs sharded strategy evaluation benchmark")
+    parser.add_argument('--strategies', type=int, default=200, help="Number of strategies (default 200)")
+    parser.add_argument('--workers', default=None,
+                        help="Comma-separated worker counts to compare with 1 worker (default: 2,4,... up to the CPU count)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING) # Strategies log every run at INFO
+    cpus = os.cpu_count() or 1
+    requested = {int(count) for count in args.workers.split(',')} if args.workers else \
+        {2 ** i for i in range(1, cpus.bit_length())} | {cpus}
+    worker_counts = sorted({1} | requested) # 1 worker is the baseline for the speedup column
+
+    specs = _strategy_specs(args.strategies)
+    klines = {f"SYM{i}": _make_klines(KLINES, i) for i in range(min(SYMBOLS, args.strategies))}
+
+    print(f"{args.strategies} SMA({STRATEGY_CONFIG['short_window']},{STRATEGY_CONFIG['long_window']}) strategies on "
+          f"{len(klines)} symbols x {KLINES} klines, mean over {CYCLES} cycles, {cpus} CPUs")
+    if cpus == 1:
+        print("note: 1 CPU, so workers take turns on it; this run can't show scaling")
+    print(f"{'mode':<15}{'ms/cycle':>10}{'strat/s':>10}{'vs 1 worker':>13}")
+    inline_s = _bench_inline(specs, klines)
+    print(f"{'inline':<15}{inline_s * 1000:>10.1f}{args.strategies / inline_s:>10.0f}{'':>13}")
+    single_s = None
+    for num_workers in worker_counts:
+        elapsed = _bench_sharded(specs, klines, num_workers)
+        if num_workers == 1:
+            single_s = elapsed
+        print(f"{f'{num_workers} worker(s)':<15}{elapsed * 1000:>10.1f}{args.strategies / elapsed:>10.0f}"
+              f"{single_s / elapsed:>12.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1 @@
+# Lets a plain `pytest` run from the project root import arbix_core, as `python -m pytest` does.
@@ -1,28 +1,343 @@
 import logging
 import configparser
+import argparse
 import asyncio
+import multiprocessing
+import time
 import pandas as pd 
 from datetime import datetime 
 
 from arbix_core.utils.logger import setup_logging
 from arbix_core.connectors.telegram_bot import TelegramBot
 from arbix_core.connectors.binance_connector import BinanceConnector
+from arbix_core.utils.candle_scheduler import CandleCloseScheduler
+from arbix_core.events.event_bus import EventBus, BLOCK, DROP_OLDEST, CONFLATE
+from arbix_core.events.events import KlineEvent, SignalEvent, NotificationEvent
+from arbix_core.events.kline_feed import KlineFeed
+from arbix_core.connectors.market_recorder import MarketDataRecorder
+from arbix_core.connectors.market_replay import MarketReplayer
 
 # Import the new strategy components
 from arbix_core.strategy.example_strategy import SMACrossoverStrategy
-from arbix_core.strategy.base_strategy import StrategySignal # For type hinting or direct use
+from arbix_core.strategy.base_strategy import BaseStrategy, StrategySignal # For type hinting or direct use
+from arbix_core.strategy.checkpoint import CheckpointManager
+from arbix_core.strategy.sharded_runner import ShardedStrategyRunner
+from arbix_core.utils.shared_klines import RING_ROW_BYTES
+from arbix_core.utils.time_utils import candles_between, now_ms
+from arbix_core.utils.config_service import get_config_service
 
 # Setup logging first
 setup_logging(default_path='config/logging_config.json')
 logger = logging.getLogger(__name__)
 
+DEFAULT_KLINE_MARGIN = 30 # Klines kept beyond a strategy's required_klines(), memory budget permitting
+EXECUTION_MODES = ('inline', 'sharded') # [EXECUTION] mode: strategies in the event loop, or in worker processes
+
+def get_execution_mode(config) -> str:
+    mode = config.get('EXECUTION', 'mode', fallback='inline').strip().lower()
+    if mode not in EXECUTION_MODES:
+        logger.error(f"Unknown [EXECUTION] mode {mode!r}; expected one of {EXECUTION_MODES}. Using 'inline'.")
+        return 'inline'
+    return mode
+
+def get_mp_context(config) -> str:
+    """
+    [EXECUTION] mp_context: start method for strategy workers. Defaults to 'forkserver', since
+    forking this multithreaded process (clock sync, to_thread fetches, respawns from a worker
+    thread) can leave a child holding locks no thread will ever release.
+    """
+    start_method = config.get('EXECUTION', 'mp_context', fallback='forkserver').strip().lower()
+    available = multiprocessing.get_all_start_methods()
+    if start_method not in available:
+        logger.error(f"Unsupported [EXECUTION] mp_context {start_method!r}; expected one of {available}. Using 'spawn'.")
+        return 'spawn'
+    return start_method
+
+def make_kline_feed(bus: EventBus, config, mirror_row_bytes: int = 0) -> KlineFeed:
+    """
+    KlineFeed sized by the [MEMORY] section: a global budget for all kline buffers and the retention margin.
+    `mirror_row_bytes` accounts for copies held elsewhere, e.g. the shared-memory rings in sharded mode.
+    """
+    budget_mb = config.getfloat('MEMORY', 'market_data_budget_mb', fallback=256.0)
+    return KlineFeed(
+        bus,
+        memory_budget_bytes=int(budget_mb * 1024 * 1024) if budget_mb > 0 else None,
+        margin_klines=config.getint('MEMORY', 'kline_margin', fallback=DEFAULT_KLINE_MARGIN),
+        mirror_row_bytes=mirror_row_bytes
+    )
+
+def format_signal_message(strategy_id: str, signal_object: StrategySignal) -> str:
+    """Formats a strategy signal for a Telegram notification."""
+    details_str_parts = []
+    if 'price_at_signal' in signal_object.details:
+        details_str_parts.append(f"Price: {signal_object.details['price_at_signal']:.4f}")
+    if 'short_sma' in signal_object.details:
+        details_str_parts.append(f"SMA Short: {signal_object.details['short_sma']:.4f}")
+    if 'long_sma' in signal_object.details:
+        details_str_parts.append(f"SMA Long: {signal_object.details['long_sma']:.4f}")
+    if 'reason' in signal_object.details:
+        details_str_parts.append(f"Reason: {signal_object.details['reason']}")
+
+    details_for_tg = "\n".join(details_str_parts)
+    return (f"Strategy: {strategy_id}\n"
+            f"Symbol: {signal_object.symbol}\n"
+            f"Signal: {signal_object.signal_type}\n"
+            f"{details_for_tg}")
+
+def last_kline_open_ms(klines_df: pd.DataFrame) -> int:
+    """Open time (epoch ms) of the last kline in a DataFrame indexed by open_time."""
+    return int(klines_df.index[-1:].values.astype('datetime64[ms]').astype('int64')[0])
+
+def load_strategy_klines(strategy: BaseStrategy, binance_connector: BinanceConnector,
+                         checkpoint_manager: CheckpointManager, interval: str, num_klines: int) -> bool:
+    """
+    Loads the kline buffer a strategy needs before its first run.
+    If a recent checkpoint exists and, with the candles missed since it was written, still
+    covers required_klines(), only those missed candles are fetched; otherwise the full
+    history of `num_klines` candles is fetched.
+    Returns True if the strategy has kline data to run on.
+    """
+    if checkpoint_manager.restore(strategy) and not strategy.current_klines.empty:
+        last_open_ms = last_kline_open_ms(strategy.current_klines)
+        missed = candles_between(interval, last_open_ms, now_ms())
+        required = strategy.required_klines() or 0
+        if len(strategy.current_klines) + missed < required:
+            # E.g. long_window grew since the snapshot: its older klines were never stored
+            logger.info(f"Checkpoint for {strategy.strategy_id} holds {len(strategy.current_klines)} klines, "
+                        f"{required} are required; doing a full fetch instead.")
+        elif missed < num_klines:
+            # Start at the last stored candle: it may have still been forming when the snapshot was taken
+            logger.info(f"Fetching {missed + 1} klines missed since checkpoint for strategy {strategy.strategy_id}...")
+            missed_klines_df = binance_connector.get_futures_klines_df(
+                symbol=strategy.symbol,
+                interval=interval,
+                start_time_ms=last_open_ms,
+                limit=missed + 1
+            )
+            if missed_klines_df is not None:
+                strategy.append_data(missed_klines_df, max_rows=num_klines)
+                return True
+            logger.warning(f"Could not fetch missed klines for {strategy.strategy_id}; falling back to a full fetch.")
+        else:
+            logger.info(f"Checkpoint for {strategy.strategy_id} is {missed} candles old; doing a full fetch instead.")
+
+    logger.info(f"Fetching initial {num_klines} klines for strategy {strategy.strategy_id}...")
+    initial_klines_df = binance_connector.get_futures_klines_df(
+        symbol=strategy.symbol,
+        interval=interval,
+        limit=num_klines
+    )
+    if initial_klines_df is not None and not initial_klines_df.empty:
+        logger.info(f"Successfully fetched {len(initial_klines_df)} initial klines for strategy {strategy.strategy_id}.")
+        strategy.update_data(initial_klines_df) # Feed data to the strategy
+        return True
+    return False
+
+async def run_market_data_loop(feed: KlineFeed, binance_connector: BinanceConnector, scheduler: CandleCloseScheduler,
+                               metrics_interval_seconds: float):
+    """
+    Producer side of the pipeline: right after each candle closes on the exchange clock,
+    fetches the new closed candles once per (symbol, interval) and publishes them through
+    the KlineFeed. Strategies and notifiers consume from the bus.
+    """
+    last_metrics_log = time.monotonic()
+    while True:
+        close_ms = await scheduler.wait_for_next_close()
+        for symbol, interval in feed.markets():
+            klines_df = await asyncio.to_thread(
+                binance_connector.get_futures_klines_df,
+                symbol=symbol,
+                interval=interval,
+                start_time_ms=feed.last_open_ms(symbol, interval),
+                end_time_ms=close_ms - 1, # Up to and including the candle that just closed
+                limit=feed.buffer_sizes[(symbol, interval)]
+            )
+            if klines_df is None:
+                logger.error(f"Failed to fetch klines for {symbol} {interval} at candle close {close_ms}. Skipping this candle.")
+                continue
+            await feed.publish(symbol, interval, klines_df, close_ms)
+
+        if time.monotonic() - last_metrics_log >= metrics_interval_seconds:
+            feed.bus.log_metrics()
+            feed.log_memory_report()
+            logger.info(f"Close-to-evaluation lag report: {scheduler.lag_report()}")
+            last_metrics_log = time.monotonic()
+
+def make_strategy_handler(strategy: BaseStrategy, interval: str, bus: EventBus,
+                          checkpoint_manager: CheckpointManager | None, feed: KlineFeed):
+    """
+    KlineEvent handler that runs one strategy on its symbol's candles and publishes its signal.
+    The strategy keeps as many klines as the feed retains for its market, read on every event
+    since retention changes with parameter updates and the memory budget.
+    """
+    async def handle_klines(event: KlineEvent):
+        if event.symbol != strategy.symbol or event.interval != interval:
+            return
+        strategy.append_data(event.klines_df, max_rows=feed.buffer_sizes[(strategy.symbol, interval)])
+        signal_object = strategy.run()
+        if checkpoint_manager:
+            checkpoint_manager.maybe_save(strategy)
+        if signal_object:
+            await bus.publish(SignalEvent(strategy.strategy_id, signal_object, event.close_ms))
+    return handle_klines
+
+def start_sharded_runner(strategies: list, feed: KlineFeed, interval: str, config) -> ShardedStrategyRunner:
+    """
+    Starts worker processes running copies of `strategies` (built from their class and config).
+    Each symbol's shared-memory ring holds as many klines as the feed retains for it, which the
+    feed counts against the [MEMORY] budget (see make_kline_feed).
+    """
+    runner = ShardedStrategyRunner(
+        num_workers=config.getint('EXECUTION', 'workers', fallback=0) or None, # 0: one per CPU
+        mp_context=get_mp_context(config),
+        max_missed_cycles=config.getint('EXECUTION', 'max_missed_cycles', fallback=3),
+        ring_capacities={strategy.symbol: feed.buffer_sizes[(strategy.symbol, interval)] for strategy in strategies}
+    )
+    for strategy in strategies:
+        runner.add_strategy(type(strategy), strategy.strategy_id, strategy.symbol, strategy.config)
+    runner.start()
+    logger.info(f"Sharded execution: {len(strategies)} strategies on {min(runner.num_workers, len(strategies))} "
+                f"{runner.start_method} workers, "
+                f"{runner.shared_memory_bytes() / 1024:.1f} kB of shared kline rings.")
+    return runner
+
+def make_sharded_strategy_handler(runner: ShardedStrategyRunner, interval: str, bus: EventBus, cycle_timeout: float):
+    """
+    KlineEvent handler for sharded execution: writes each event's klines into the runner's shared
+    rings and evaluates the strategies on the worker processes, publishing their signals.
+
+    Symbols whose events are still queued behind this one are evaluated together in a single
+    cycle, so all workers run in parallel instead of one symbol at a time. Every event is still
+    evaluated: a second event for a symbol already waiting flushes the batch first. Set
+    `.subscription` on the returned handler to the Subscription it was registered with to enable
+    that batching.
+    """
+    pending = {} # symbol -> close_ms of its latest KlineEvent not evaluated yet
+
+    async def run_pending():
+        close_ms_by_symbol = dict(pending)
+        pending.clear()
+        signals = await asyncio.to_thread(runner.run_cycle, list(close_ms_by_symbol), cycle_timeout)
+        for strategy_id, signal_object in signals.items():
+            await bus.publish(SignalEvent(strategy_id, signal_object, close_ms_by_symbol.get(signal_object.symbol)))
+
+    async def handle_klines(event: KlineEvent):
+        if event.interval != interval:
+            return
+        if event.symbol in pending:
+            await run_pending()
+        runner.publish_klines(event.symbol, event.klines_df)
+        pending[event.symbol] = event.close_ms
+        subscription = handle_klines.subscription
+        if subscription is not None and len(subscription):
+            return # More klines queued: evaluate them all in one cycle
+        await run_pending()
+
+    handle_klines.subscription = None
+    return handle_klines
+
+def subscribe_strategies(bus: EventBus, feed: KlineFeed, strategies: list, interval: str, config, execution_mode: str,
+                         checkpoint_manager: CheckpointManager | None, maxsize: int,
+                         policy: str) -> ShardedStrategyRunner | None:
+    """
+    Registers the strategies' kline requirements with the feed and subscribes them to KlineEvents,
+    either one handler per strategy (inline) or one handler feeding worker processes (sharded).
+    :return: The started ShardedStrategyRunner in sharded mode, else None.
+    """
+    feed.add_strategies(strategies, interval)
+    if execution_mode != 'sharded':
+        for strategy in strategies:
+            bus.subscribe(KlineEvent, make_strategy_handler(strategy, interval, bus, checkpoint_manager, feed),
+                          name=f"strategy-{strategy.strategy_id}", maxsize=maxsize, policy=policy)
+        return None
+
+    runner = start_sharded_runner(strategies, feed, interval, config)
+    handler = make_sharded_strategy_handler(runner, interval, bus,
+                                            config.getfloat('EXECUTION', 'cycle_timeout_seconds', fallback=10.0))
+    handler.subscription = bus.subscribe(KlineEvent, handler, name="strategy-workers", maxsize=maxsize, policy=policy)
+    return runner
+
+def make_signal_handler(bus: EventBus, scheduler: CandleCloseScheduler | None):
+    """SignalEvent handler: records close-to-evaluation lag and turns trade signals into notifications."""
+    async def handle_signal(event: SignalEvent):
+        if scheduler and event.close_ms is not None:
+            lag_ms = scheduler.record_evaluation(event.close_ms)
+            logger.info(f"Strategy {event.strategy_id} signal {event.signal.signal_type} for candle close "
+                        f"{event.close_ms}: close-to-evaluation lag {lag_ms:.0f}ms")
+        if event.signal.signal_type in ("BUY", "SELL"):
+            await bus.publish(NotificationEvent(format_signal_message(event.strategy_id, event.signal)))
+    return handle_signal
+
+def make_sma_config_listener(strategies: list, feed: KlineFeed, interval: str):
+    """
+    ConfigService listener for [STRATEGY_SMA_CROSS]: hot-applies new windows to the running
+    SMACrossoverStrategy instances using the klines they already hold (no restart, no refetch).
+    """
+    def on_sma_config_change(section: str, changes: dict):
+        short_window = changes.get('short_window')
+        long_window = changes.get('long_window')
+        if short_window is None and long_window is None:
+            return
+        updated = [strategy for strategy in strategies if isinstance(strategy, SMACrossoverStrategy) and
+                   strategy.update_parameters(short_window=int(short_window) if short_window is not None else None,
+                                              long_window=int(long_window) if long_window is not None else None)]
+        if updated:
+            feed.add_strategies(updated, interval) # Re-sizes the markets' buffers for the new long_window
+    return on_sma_config_change
+
+async def run_replay(replay_path: str, speed: float | None):
+    """
+    Replays a market data recording through the real strategies and event bus, without
+    Binance, Telegram or checkpoints, and logs the end-to-end throughput.
+    """
+    config_path = 'config/config.ini'
+    try:
+        config = get_config_service(config_path) # Loaded once, shared with the connectors
+    except FileNotFoundError:
+        logger.critical(f"CRITICAL: Configuration file {config_path} not found. Exiting.")
+        return
+
+    symbol = config.get('TRADING', 'default_symbol_futures', fallback="BTCUSDT")
+    interval = config.get('TRADING', 'default_kline_interval', fallback="1m")
+    sma_strategy_config = {
+        'short_window': config.getint('STRATEGY_SMA_CROSS', 'short_window', fallback=10),
+        'long_window': config.getint('STRATEGY_SMA_CROSS', 'long_window', fallback=20)
+    }
+    strategy = SMACrossoverStrategy(
+        strategy_id=f"SMA_Cross_{symbol}_{interval}",
+        symbol=symbol,
+        config=sma_strategy_config
+    )
+
+    execution_mode = get_execution_mode(config)
+    bus = EventBus()
+    feed = make_kline_feed(bus, config, mirror_row_bytes=RING_ROW_BYTES if execution_mode == 'sharded' else 0)
+    # BLOCK rather than conflate so every recorded candle is evaluated and runs are deterministic
+    runner = subscribe_strategies(bus, feed, [strategy], interval, config, execution_mode, None, maxsize=1000, policy=BLOCK)
+    bus.subscribe(SignalEvent, make_signal_handler(bus, None), name="signal-router", maxsize=1000, policy=BLOCK)
+    bus.start()
+
+    logger.info(f"Replaying {replay_path} at {'max' if speed is None else f'{speed}x'} speed into {strategy.strategy_id}...")
+    try:
+        report = await MarketReplayer(replay_path, feed, speed=speed).run()
+    finally:
+        await bus.stop(drain=True)
+        if runner:
+            runner.stop()
+    bus.log_metrics()
+    feed.log_memory_report()
+    signals = bus.metrics().get('signal', {}).get('published', 0)
+    logger.info(f"Replay report: {report} signals={signals} "
+                f"({signals / report['elapsed_s'] if report['elapsed_s'] else 0.0:.0f} signals/s end to end)")
+
 async def main():
     logger.info("Starting Arbix application...")
 
     # Load main configuration
-    config = configparser.ConfigParser()
     config_path = 'config/config.ini'
-    if not config.read(config_path):
+    try:
+        config = get_config_service(config_path) # Loaded once, shared with the connectors
+    except FileNotFoundError:
         logger.critical(f"CRITICAL: Configuration file {config_path} not found. Exiting.")
         return
     
@@ -52,14 +367,24 @@ async def main():
         use_testnet = True
         
     binance_connector = None
+    clock_sync = None
     try:
         binance_connector = BinanceConnector(config_path=config_path, testnet=use_testnet)
         if binance_connector.client: # Check if the underlying client in connector is initialized
             logger.info(f"Binance Connector initialized successfully. Testnet: {use_testnet}")
+            clock_sync = binance_connector.clock_sync # Synced by the connector before its first signed request
+            clock_sync.start()
+            if config.getboolean('RECORDER', 'enabled', fallback=False):
+                # Capture every kline payload (initial history included) for offline replay
+                binance_connector.recorder = MarketDataRecorder(
+                    config.get('RECORDER', 'path', fallback='data/recordings/market_data.arbx'),
+                    chunk_records=config.getint('RECORDER', 'chunk_records', fallback=256)
+                )
             if telegram_bot:
                 server_time = binance_connector.get_futures_server_time()
                 if server_time:
-                    message_text = f"Binance Futures connection successful. Server Time: {server_time}"
+                    message_text = (f"Binance Futures connection successful. Server Time: {server_time} "
+                                    f"(clock offset {clock_sync.offset_ms:.0f}ms, RTT {clock_sync.rtt_ms:.0f}ms)")
                     await telegram_bot.send_message(message_text)
                 else:
                     message_text = "Binance Futures connection successful, but couldn't fetch server time."
@@ -110,6 +435,10 @@ async def main():
 
     # --- Strategy Initialization and Execution ---
     active_strategies = [] # To hold initialized strategy objects
+    checkpoint_manager = CheckpointManager(
+        directory=config.get('CHECKPOINT', 'directory', fallback='data/checkpoints'),
+        interval_seconds=config.getfloat('CHECKPOINT', 'interval_seconds', fallback=60.0)
+    )
     if binance_connector and binance_connector.client: # Ensure connector is up
         
         # Get strategy parameters from config
@@ -148,46 +477,20 @@ async def main():
                             f"for {symbol_to_trade} {kline_interval_strategy} using windows "
                             f"({sma_strategy_config['short_window']},{sma_strategy_config['long_window']})")
 
-                # Fetch enough klines for indicators
-                # Need at least long_window candles +1 for prev, +1 for current, so long_window + 2.
-                # Fetching more (e.g., long_window * 2 or a fixed number like 50-100) is safer for stability.
-                num_klines_to_fetch = sma_strategy_config['long_window'] + 30 # Fetch ample buffer
+                # Fetch enough klines for indicators: what the strategy needs plus the retention margin.
+                # The KlineFeed may keep fewer later if the memory budget requires it.
+                num_klines_to_fetch = sma_strategy.required_klines() + \
+                    config.getint('MEMORY', 'kline_margin', fallback=DEFAULT_KLINE_MARGIN)
                 
-                logger.info(f"Fetching initial {num_klines_to_fetch} klines for strategy {sma_strategy.strategy_id}...")
-                initial_klines_df = binance_connector.get_futures_klines_df(
-                    symbol=symbol_to_trade,
-                    interval=kline_interval_strategy,
-                    limit=num_klines_to_fetch
-                )
-
-                if initial_klines_df is not None and not initial_klines_df.empty:
-                    logger.info(f"Successfully fetched {len(initial_klines_df)} initial klines for strategy {sma_strategy.strategy_id}.")
-                    
-                    sma_strategy.update_data(initial_klines_df) # Feed data to the strategy
+                if load_strategy_klines(sma_strategy, binance_connector, checkpoint_manager,
+                                        kline_interval_strategy, num_klines_to_fetch):
                     signal_object = sma_strategy.run()          # Run the strategy to get a signal
+                    checkpoint_manager.save(sma_strategy)       # Snapshot for a warm restart
 
                     if signal_object and isinstance(signal_object, StrategySignal):
                         logger.info(f"Strategy {sma_strategy.strategy_id} generated initial signal: {signal_object.signal_type} - Details: {signal_object.details}")
                         if telegram_bot:
-                            # Format details for telegram message
-                            details_str_parts = []
-                            if 'price_at_signal' in signal_object.details:
-                                details_str_parts.append(f"Price: {signal_object.details['price_at_signal']:.4f}")
-                            if 'short_sma' in signal_object.details:
-                                details_str_parts.append(f"SMA Short: {signal_object.details['short_sma']:.4f}")
-                            if 'long_sma' in signal_object.details:
-                                details_str_parts.append(f"SMA Long: {signal_object.details['long_sma']:.4f}")
-                            if 'reason' in signal_object.details:
-                                details_str_parts.append(f"Reason: {signal_object.details['reason']}")
-                            
-                            details_for_tg = "\n".join(details_str_parts)
-
-                            await telegram_bot.send_message(
-                                f"Strategy: {sma_strategy.strategy_id}\n"
-                                f"Symbol: {signal_object.symbol}\n"
-                                f"Signal: {signal_object.signal_type}\n"
-                                f"{details_for_tg}"
-                            )
+                            await telegram_bot.send_message(format_signal_message(sma_strategy.strategy_id, signal_object))
                     else:
                         logger.warning(f"Strategy {sma_strategy.strategy_id} did not generate a valid signal object on initial run. Received: {signal_object}")
                         if telegram_bot:
@@ -214,14 +517,91 @@ async def main():
         if telegram_bot: await telegram_bot.send_message("Error: Binance connector failed. Strategies not running.")
 
 
-    logger.info("Arbix application setup complete. Entering main loop (not yet implemented)...")
+    logger.info("Arbix application setup complete. Entering main loop...")
     if telegram_bot:
         message_text = f"{project_name} main process finished setup phase."
         await telegram_bot.send_message(message_text)
 
+    if not active_strategies:
+        logger.warning("No active strategies. Nothing to run in the main loop.")
+        if clock_sync:
+            clock_sync.stop()
+        if binance_connector and binance_connector.recorder:
+            binance_connector.recorder.close()
+        return
+
+    try:
+        scheduler = CandleCloseScheduler(
+            clock_sync,
+            interval=kline_interval_strategy,
+            safety_margin_ms=config.getint('CLOCK', 'candle_close_margin_ms', fallback=50)
+        )
+    except ValueError as e:
+        logger.critical(f"Kline interval {kline_interval_strategy!r} is not supported by the candle scheduler: {e}")
+        if telegram_bot:
+            await telegram_bot.send_message(f"CRITICAL: Kline interval {kline_interval_strategy} is not supported. Exiting.")
+        clock_sync.stop()
+        if binance_connector.recorder:
+            binance_connector.recorder.close()
+        return
+
+    # --- Event bus wiring: market data -> strategies -> signals -> notifications ---
+    bus = EventBus()
+    strategy_queue_size = config.getint('EVENT_BUS', 'strategy_queue_size', fallback=100)
+    # Conflating is safe for strategies: every KlineEvent carries the whole recent buffer, not just the new candle
+    strategy_overflow_policy = config.get('EVENT_BUS', 'strategy_overflow_policy', fallback=CONFLATE)
+    # One recent-klines buffer per (symbol, interval), shared by all strategies on it and
+    # sized from their requirements within the [MEMORY] budget
+    execution_mode = get_execution_mode(config)
+    feed = make_kline_feed(bus, config, mirror_row_bytes=RING_ROW_BYTES if execution_mode == 'sharded' else 0)
+    runner = subscribe_strategies(bus, feed, active_strategies, kline_interval_strategy, config, execution_mode,
+                                  checkpoint_manager, maxsize=strategy_queue_size, policy=strategy_overflow_policy)
+    bus.subscribe(SignalEvent, make_signal_handler(bus, scheduler), name="signal-router", maxsize=1000, policy=BLOCK)
+    if telegram_bot:
+        bus.subscribe(NotificationEvent, lambda event: telegram_bot.send_message(event.message),
+                      name="telegram", maxsize=100, policy=DROP_OLDEST)
+    bus.start()
+    feed.log_memory_report()
+
+    if runner is None:
+        # Hot reload: strategy parameter edits in config.ini apply to the running strategies
+        config.subscribe('STRATEGY_SMA_CROSS', make_sma_config_listener(active_strategies, feed, kline_interval_strategy))
+    else:
+        logger.warning("Sharded execution: strategies run in worker processes, so [STRATEGY_SMA_CROSS] changes "
+                       "need a restart and periodic checkpoints are not written.")
+    config_watch_task = asyncio.create_task(
+        config.watch(config.getfloat('DEFAULT', 'config_watch_interval_seconds', fallback=2.0))
+    )
+
+    try:
+        await run_market_data_loop(feed, binance_connector, scheduler,
+                                   metrics_interval_seconds=config.getfloat('EVENT_BUS', 'metrics_log_interval_seconds', fallback=300.0))
+    finally:
+        config_watch_task.cancel()
+        await bus.stop(drain=True)
+        bus.log_metrics()
+        clock_sync.stop()
+        if binance_connector.recorder:
+            binance_connector.recorder.close()
+        if runner:
+            runner.stop() # The parent's strategy objects never saw live candles; keep the last good checkpoints
+        else:
+            for strategy in active_strategies:
+                checkpoint_manager.save(strategy)
+        logger.info(f"Close-to-evaluation lag report: {scheduler.lag_report()}")
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Arbix trading bot")
+    parser.add_argument('--replay', metavar='RECORDING',
+                        help="Replay a market data recording through the strategies instead of trading live")
+    parser.add_argument('--speed', default='max',
+                        help="Replay speed: a multiplier such as 1 or 10, or 'max' (default)")
+    args = parser.parse_args()
     try:
-        asyncio.run(main())
+        if args.replay:
+            asyncio.run(run_replay(args.replay, None if args.speed == 'max' else float(args.speed)))
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Arbix application shutting down by user request (KeyboardInterrupt).")
     except Exception as e:
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+from arbix_core.strategy.checkpoint import CheckpointManager
+from arbix_core.strategy.example_strategy import SMACrossoverStrategy
+
+CONFIG = {'short_window': 5, 'long_window': 10}
+
+
+def _klines(n: int = 40) -> pd.DataFrame:
+    index = pd.to_datetime(1_700_000_000_000 + np.arange(n) * 60_000, unit='ms')
+    index.name = 'open_time'
+    close = 100 + np.cumsum(np.random.default_rng(3).standard_normal(n))
+    return pd.DataFrame({
+        'close': close,
+        'volume': close * 2,
+        'close_time': index + pd.Timedelta(milliseconds=59_999),
+        'number_of_trades': np.arange(n, dtype=np.int64),
+    }, index=index)
+
+
+def _saved_strategy(manager: CheckpointManager) -> SMACrossoverStrategy:
+    strategy = SMACrossoverStrategy('sma', 'BTCUSDT', dict(CONFIG))
+    strategy.update_data(_klines())
+    strategy.run()
+    assert manager.save(strategy)
+    return strategy
+
+
+def test_round_trip(tmp_path):
+    manager = CheckpointManager(str(tmp_path))
+    saved = _saved_strategy(manager)
+
+    restored = SMACrossoverStrategy('sma', 'BTCUSDT', dict(CONFIG))
+    meta = manager.restore(restored)
+    assert meta is not None and meta['strategy_id'] == 'sma'
+    pdt.assert_frame_equal(restored.current_klines, saved.current_klines, check_index_type=False, check_dtype=False)
+    assert restored.last_crossover_state == saved.last_crossover_state
+    assert [p.name for p in tmp_path.iterdir()] == ['sma.npz'] # No temporary file left behind
+
+
+def test_mismatched_checkpoint_is_rejected(tmp_path):
+    manager = CheckpointManager(str(tmp_path))
+    _saved_strategy(manager)
+    (tmp_path / 'sma.npz').rename(tmp_path / 'other.npz')
+
+    for strategy in (SMACrossoverStrategy('other', 'BTCUSDT', dict(CONFIG)),  # Different strategy_id
+                     SMACrossoverStrategy('sma', 'ETHUSDT', dict(CONFIG))):   # Different symbol
+        path = str(tmp_path / 'other.npz')
+        assert strategy.load_checkpoint(path) is None
+        assert strategy.current_klines.empty
+        assert strategy.last_crossover_state is None
+
+
+def test_state_for_other_windows_is_not_applied(tmp_path):
+    manager = CheckpointManager(str(tmp_path))
+    _saved_strategy(manager)
+
+    restored = SMACrossoverStrategy('sma', 'BTCUSDT', {'short_window': 5, 'long_window': 20})
+    assert manager.restore(restored) is not None
+    assert len(restored.current_klines) == 40
+    assert restored.last_crossover_state is None
+
+
+def test_missing_or_corrupt_checkpoint(tmp_path):
+    manager = CheckpointManager(str(tmp_path))
+    strategy = SMACrossoverStrategy('sma', 'BTCUSDT', dict(CONFIG))
+    assert manager.restore(strategy) is None
+    (tmp_path / 'sma.npz').write_bytes(b'not a checkpoint')
+    assert manager.restore(strategy) is None
+    assert strategy.current_klines.empty
@@ -0,0 +1,90 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from arbix_core.events.event_bus import EventBus, BLOCK, DROP_OLDEST, CONFLATE
+from arbix_core.events.events import KlineEvent, NotificationEvent
+
+
+def _kline_event(symbol: str, close_ms: int) -> KlineEvent:
+    return KlineEvent(symbol, '1m', pd.DataFrame(), close_ms)
+
+
+def test_block_delivers_everything_in_order():
+    async def scenario():
+        bus = EventBus()
+        received = []
+
+        async def handler(event):
+            await asyncio.sleep(0)
+            received.append(event.message)
+
+        subscription = bus.subscribe(NotificationEvent, handler, maxsize=1, policy=BLOCK)
+        bus.start()
+        for i in range(20):
+            await bus.publish(NotificationEvent(str(i)))
+        await bus.join()
+        await bus.stop()
+        return received, subscription.metrics()
+
+    received, metrics = asyncio.run(scenario())
+    assert received == [str(i) for i in range(20)]
+    assert metrics['dropped'] == 0 and metrics['max_depth'] == 1
+
+
+def test_drop_oldest_keeps_the_newest_events():
+    async def scenario():
+        bus = EventBus()
+        received = []
+        subscription = bus.subscribe(NotificationEvent, lambda event: received.append(event.message),
+                                     maxsize=2, policy=DROP_OLDEST)
+        for i in range(5): # Not started yet, so nothing is consumed
+            await bus.publish(NotificationEvent(str(i)))
+        bus.start()
+        await bus.join()
+        await bus.stop()
+        return received, subscription.metrics()
+
+    received, metrics = asyncio.run(scenario())
+    assert received == ['3', '4']
+    assert metrics['dropped'] == 3 and metrics['delivered'] == 2
+
+
+def test_conflate_replaces_pending_events_with_the_same_key():
+    async def scenario():
+        bus = EventBus()
+        received = []
+        subscription = bus.subscribe(KlineEvent, lambda event: received.append((event.symbol, event.close_ms)),
+                                     maxsize=10, policy=CONFLATE)
+        for symbol, close_ms in [('BTCUSDT', 1), ('ETHUSDT', 1), ('BTCUSDT', 2), ('BTCUSDT', 3)]:
+            await bus.publish(_kline_event(symbol, close_ms))
+        bus.start()
+        await bus.join()
+        await bus.stop()
+        return received, subscription.metrics()
+
+    received, metrics = asyncio.run(scenario())
+    # BTCUSDT keeps its place in the queue but carries the latest candle
+    assert received == [('BTCUSDT', 3), ('ETHUSDT', 1)]
+    assert metrics['conflated'] == 2 and metrics['dropped'] == 0
+
+
+def test_conflate_drops_the_oldest_key_when_full():
+    async def scenario():
+        bus = EventBus()
+        received = []
+        bus.subscribe(KlineEvent, lambda event: received.append(event.symbol), maxsize=2, policy=CONFLATE)
+        for symbol in ('A', 'B', 'C'):
+            await bus.publish(_kline_event(symbol, 1))
+        bus.start()
+        await bus.join()
+        await bus.stop()
+        return received
+
+    assert asyncio.run(scenario()) == ['B', 'C']
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        EventBus().subscribe(NotificationEvent, lambda event: None, policy='newest')
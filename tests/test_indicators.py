@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from arbix_core.strategy import indicators
+from arbix_core.strategy.example_strategy import SMACrossoverStrategy
+
+
+def _random_walk(n: int = 500, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.standard_normal(n))
+    high = close + rng.random(n)
+    low = close - rng.random(n)
+    volume = rng.random(n) * 10
+    return high, low, close, volume
+
+
+def _stream(indicator, *columns):
+    return np.array([indicator.update(*row) for row in zip(*columns)])
+
+
+def _assert_same(batch, stream):
+    assert np.array_equal(np.isnan(batch), np.isnan(stream))
+    np.testing.assert_allclose(batch, stream, rtol=0, atol=1e-9, equal_nan=True)
+
+
+def test_batch_and_stream_agree():
+    high, low, close, volume = _random_walk()
+    _assert_same(indicators.sma(close, 20), _stream(indicators.SMA(20), close))
+    _assert_same(indicators.ema(close, 20), _stream(indicators.EMA(20), close))
+    _assert_same(indicators.rsi(close, 14), _stream(indicators.RSI(14), close))
+    _assert_same(indicators.atr(high, low, close, 14), _stream(indicators.ATR(14), high, low, close))
+    _assert_same(indicators.vwap(high, low, close, volume, 14), _stream(indicators.VWAP(14), high, low, close, volume))
+
+    bands = indicators.BollingerBands(20)
+    streamed = np.array([(bands.update(x), bands.upper, bands.lower) for x in close])
+    for batch, column in zip(indicators.bollinger(close, 20), streamed.T):
+        _assert_same(batch, column)
+
+    macd = indicators.MACD()
+    streamed = np.array([(macd.update(x), macd.signal, macd.histogram) for x in close])
+    for batch, column in zip(indicators.macd(close), streamed.T):
+        _assert_same(batch, column)
+
+
+def test_sma_is_exact_on_a_flat_series():
+    close = np.full(300, 60123.37)
+    diff = indicators.sma(close, 10) - indicators.sma(close, 20)
+    assert np.all(diff[19:] == 0.0)
+
+    short, long = indicators.SMA(10), indicators.SMA(20)
+    streamed = np.array([short.update(x) - long.update(x) for x in close])
+    assert np.all(streamed[19:] == 0.0)
+
+
+def test_flat_series_gives_no_crossover_signals():
+    index = pd.to_datetime(np.arange(300) * 60_000, unit='ms')
+    klines = pd.DataFrame({'close': np.full(300, 60123.37)}, index=index)
+    strategy = SMACrossoverStrategy('flat', 'BTCUSDT', {'short_window': 10, 'long_window': 20})
+    signals = set()
+    for end in range(21, 301):
+        strategy.update_data(klines.iloc[:end])
+        signals.add(strategy.run().signal_type)
+    assert signals == {'HOLD'}
+
+
+@pytest.mark.parametrize('name', ['ema', 'rsi', 'atr', 'macd'])
+def test_nan_inputs_are_handled_the_same_everywhere(monkeypatch, name):
+    high, low, close, _ = _random_walk(200)
+    for values in (high, low, close):
+        values[[0, 1, 50, 51, 120]] = np.nan
+
+    def batch():
+        if name == 'ema':
+            return [indicators.ema(close, 14)]
+        if name == 'rsi':
+            return [indicators.rsi(close, 14)]
+        if name == 'atr':
+            return [indicators.atr(high, low, close, 14)]
+        return list(indicators.macd(close))
+
+    def stream():
+        if name == 'ema':
+            return [_stream(indicators.EMA(14), close)]
+        if name == 'rsi':
+            return [_stream(indicators.RSI(14), close)]
+        if name == 'atr':
+            return [_stream(indicators.ATR(14), high, low, close)]
+        macd = indicators.MACD()
+        return list(np.array([(macd.update(x), macd.signal, macd.histogram) for x in close]).T)
+
+    with_default = batch()
+    monkeypatch.setattr(indicators, 'SCIPY_AVAILABLE', False)
+    with_pandas = batch()
+    for default, pandas_only, streamed in zip(with_default, with_pandas, stream()):
+        assert not np.isnan(default[-1]) # A missing candle doesn't poison the rest of the series
+        _assert_same(default, pandas_only)
+        _assert_same(default, streamed)
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+from arbix_core.connectors.market_recorder import MarketDataRecorder, MarketDataReader
+
+
+def _record(path: str, count: int, start_ms: int = 1_000, chunk_records: int = 2) -> None:
+    recorder = MarketDataRecorder(path, chunk_records=chunk_records)
+    for i in range(count):
+        recorder.record('klines', [[start_ms + i, '1.0']], recv_ms=start_ms + i, symbol='BTCUSDT', interval='1m')
+    recorder.close()
+
+
+def _times(path: str, **kwargs) -> list:
+    return [record['t'] for record in MarketDataReader(path).records(**kwargs)]
+
+
+def test_round_trip_and_time_range(tmp_path):
+    path = str(tmp_path / 'md.arbx')
+    _record(path, 7)
+    reader = MarketDataReader(path)
+    assert len(reader) == 7
+    records = list(reader.records())
+    assert records[0]['symbol'] == 'BTCUSDT' and records[0]['payload'] == [[1_000, '1.0']]
+    assert _times(path, start_ms=1_002, end_ms=1_004) == [1_002, 1_003, 1_004]
+
+
+def test_appending_to_an_existing_recording(tmp_path):
+    path = str(tmp_path / 'md.arbx')
+    _record(path, 3)
+    _record(path, 3, start_ms=2_000)
+    assert _times(path) == [1_000, 1_001, 1_002, 2_000, 2_001, 2_002]
+
+
+def test_frames_missing_from_the_index_are_recovered(tmp_path):
+    path = str(tmp_path / 'md.arbx')
+    _record(path, 6)
+    index_path = path + '.idx'
+    with open(index_path, 'rb+') as f:
+        f.truncate(os.path.getsize(index_path) - 10) # Last entry half written, e.g. a crash
+    assert _times(path) == [1_000 + i for i in range(6)]
+
+    os.remove(index_path)
+    assert _times(path) == [1_000 + i for i in range(6)]
+
+
+def test_truncated_data_tail_is_ignored(tmp_path):
+    path = str(tmp_path / 'md.arbx')
+    _record(path, 6)
+    with open(path, 'rb+') as f:
+        f.truncate(os.path.getsize(path) - 5) # Last frame cut short
+    os.remove(path + '.idx')
+    assert _times(path) == [1_000 + i for i in range(4)]
+
+
+def test_recording_resumed_after_a_crash(tmp_path):
+    path = str(tmp_path / 'md.arbx')
+    _record(path, 6)
+    with open(path, 'rb+') as f: # Crash while writing the last frame, before its index entry
+        f.truncate(os.path.getsize(path) - 5)
+    with open(path + '.idx', 'rb+') as f:
+        f.truncate(os.path.getsize(path + '.idx') - 32)
+    _record(path, 2, start_ms=2_000)
+    assert _times(path) == [1_000, 1_001, 1_002, 1_003, 2_000, 2_001]
+
+
+def test_recording_resumed_after_a_crash_in_the_index(tmp_path):
+    path = str(tmp_path / 'md.arbx')
+    _record(path, 6)
+    with open(path + '.idx', 'rb+') as f: # Last index entry half written
+        f.truncate(os.path.getsize(path + '.idx') - 10)
+    _record(path, 2, start_ms=2_000)
+    assert _times(path) == [1_000 + i for i in range(6)] + [2_000, 2_001]
+
+
+def test_missing_recording():
+    with pytest.raises(FileNotFoundError):
+        MarketDataReader('does/not/exist.arbx')
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from arbix_core.strategy import indicators
+from arbix_core.strategy.example_strategy import SMACrossoverStrategy
+
+SHORT, LONG = 5, 20
+
+
+def _klines(close) -> pd.DataFrame:
+    index = pd.to_datetime(np.arange(len(close)) * 60_000, unit='ms')
+    index.name = 'open_time'
+    return pd.DataFrame({'close': close}, index=index)
+
+
+def _random_walk_close(n: int = 600, seed: int = 1) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.round(100 + np.cumsum(rng.standard_normal(n)), 1) # Rounded so the SMAs sometimes tie
+
+
+def _side(short_sma: float, long_sma: float) -> str:
+    if short_sma > long_sma:
+        return "ABOVE"
+    return "BELOW" if short_sma < long_sma else "EQUAL"
+
+
+def _expected_signal(previous_side: str, short_sma: float, long_sma: float) -> str:
+    if previous_side != "ABOVE" and short_sma > long_sma:
+        return "BUY"
+    if previous_side != "BELOW" and short_sma < long_sma:
+        return "SELL"
+    return "HOLD"
+
+
+def test_matches_two_row_crossover_when_every_candle_is_evaluated():
+    close = _random_walk_close()
+    klines = _klines(close)
+    short_sma, long_sma = indicators.sma(close, SHORT), indicators.sma(close, LONG)
+    strategy = SMACrossoverStrategy('sma', 'BTCUSDT', {'short_window': SHORT, 'long_window': LONG})
+
+    trades = 0
+    for i in range(LONG, len(close)):
+        strategy.update_data(klines.iloc[:i + 1])
+        expected = _expected_signal(_side(short_sma[i - 1], long_sma[i - 1]), short_sma[i], long_sma[i])
+        assert strategy.run().signal_type == expected, f"candle {i}"
+        trades += expected in ("BUY", "SELL")
+    assert trades > 10
+
+
+def test_crossovers_between_evaluated_candles_are_not_missed():
+    close = _random_walk_close()
+    klines = _klines(close)
+    short_sma, long_sma = indicators.sma(close, SHORT), indicators.sma(close, LONG)
+    strategy = SMACrossoverStrategy('sma', 'BTCUSDT', {'short_window': SHORT, 'long_window': LONG})
+
+    evaluated = range(LONG, len(close), 3) # e.g. conflated events
+    previous = None
+    for i in evaluated:
+        strategy.update_data(klines.iloc[:i + 1])
+        signal = strategy.run().signal_type
+        if previous is None:
+            previous = _side(short_sma[i - 1], long_sma[i - 1])
+        assert signal == _expected_signal(previous, short_sma[i], long_sma[i]), f"candle {i}"
+        previous = _side(short_sma[i], long_sma[i])
+
+
+def test_update_parameters_rederives_the_crossover_side():
+    # Falling prices with a late bounce: short(3) is above long(6), short(10) still below long(40)
+    close = np.r_[np.linspace(200, 100, 57), [110, 120, 130]]
+    klines = _klines(close)
+    strategy = SMACrossoverStrategy('sma', 'BTCUSDT', {'short_window': 3, 'long_window': 6})
+    strategy.update_data(klines.iloc[:59])
+    strategy.run()
+    assert strategy.last_crossover_state == "ABOVE"
+
+    assert strategy.update_parameters(short_window=10, long_window=40)
+    assert strategy.last_crossover_state == "BELOW"
+    strategy.update_data(klines)
+    assert strategy.run().signal_type == "HOLD" # Not a BUY carried over from the (3, 6) side
+
+
+def test_update_parameters_rejects_invalid_windows():
+    strategy = SMACrossoverStrategy('sma', 'BTCUSDT', {'short_window': 3, 'long_window': 6})
+    assert not strategy.update_parameters(short_window=10, long_window=5)
+    assert (strategy.short_window, strategy.long_window) == (3, 6)
+
+
+def test_restored_side_allows_a_signal_with_one_complete_row():
+    strategy = SMACrossoverStrategy('sma', 'BTCUSDT', {'short_window': SHORT, 'long_window': LONG})
+    strategy.set_state({'short_window': SHORT, 'long_window': LONG, 'last_crossover_state': "BELOW"})
+    strategy.update_data(_klines(np.r_[np.full(LONG - 1, 100.0), 200.0]))
+    assert strategy.run().signal_type == "BUY"
+
+
+def test_state_from_other_windows_is_ignored():
+    strategy = SMACrossoverStrategy('sma', 'BTCUSDT', {'short_window': SHORT, 'long_window': LONG})
+    strategy.set_state({'short_window': SHORT, 'long_window': 100, 'last_crossover_state': "BELOW"})
+    assert strategy.last_crossover_state is None
@@ -0,0 +1,49 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from arbix_core.utils.time_utils import candles_between, interval_to_ms, next_kline_open_ms
+
+
+def _ms(*args) -> int:
+    return int(datetime(*args, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def test_interval_to_ms():
+    assert interval_to_ms('1s') == 1_000
+    assert interval_to_ms('15m') == 15 * 60_000
+    assert interval_to_ms('1w') == 7 * 24 * 3_600_000
+    for interval in ('1M', 'm', '1x', ''):
+        with pytest.raises(ValueError):
+            interval_to_ms(interval)
+
+
+def test_next_open_for_fixed_intervals():
+    assert next_kline_open_ms('1m', _ms(2024, 1, 1, 0, 0, 30)) == _ms(2024, 1, 1, 0, 1)
+    assert next_kline_open_ms('4h', _ms(2024, 1, 1, 5)) == _ms(2024, 1, 1, 8)
+    # Strictly after: a timestamp on a boundary belongs to the candle opening there
+    assert next_kline_open_ms('1h', _ms(2024, 1, 1, 5)) == _ms(2024, 1, 1, 6)
+
+
+def test_weeks_open_on_monday():
+    # 2024-01-04 is a Thursday, 2024-01-08 a Monday
+    assert next_kline_open_ms('1w', _ms(2024, 1, 4, 12)) == _ms(2024, 1, 8)
+    assert next_kline_open_ms('1w', _ms(2024, 1, 8)) == _ms(2024, 1, 15)
+    assert candles_between('1w', _ms(2024, 1, 1), _ms(2024, 1, 29)) == 4
+
+
+@pytest.mark.parametrize('interval, now, expected', [
+    ('1M', (2024, 1, 15), (2024, 2, 1)),
+    ('1M', (2024, 2, 1), (2024, 3, 1)),     # Leap-year February still ends on the 1st
+    ('1M', (2023, 12, 31, 23), (2024, 1, 1)),
+    ('3M', (2024, 5, 10), (2024, 7, 1)),    # Quarters align to January
+])
+def test_next_open_for_months(interval, now, expected):
+    assert next_kline_open_ms(interval, _ms(*now)) == _ms(*expected)
+
+
+def test_candles_between_months():
+    assert candles_between('1M', _ms(2024, 1, 1), _ms(2024, 1, 31)) == 0
+    assert candles_between('1M', _ms(2024, 1, 1), _ms(2024, 3, 1)) == 2
+    assert candles_between('1M', _ms(2023, 11, 1), _ms(2024, 2, 15)) == 3
+    assert candles_between('1M', _ms(2024, 3, 1), _ms(2024, 1, 1)) == 0